@@ -17,6 +17,11 @@ from sentry_sdk.integrations.logging import LoggingIntegration
 import structlog  # v23.1.0
 from structlog.types import Processor
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; structlog falls back to json.dumps
+    orjson = None
+
 from ..config import settings
 
 # Constants
@@ -28,6 +33,9 @@ LOG_QUEUE_SIZE = 10000
 # Initialize the base logger
 logger = structlog.get_logger(__name__)
 
+# Listener writing queued records to the console, started by setup_logging()
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 def setup_logging() -> None:
     """
     Configures comprehensive logging for the Content Discovery Service with
@@ -79,7 +87,8 @@ def setup_logging() -> None:
     # Add environment-specific processors
     if settings.ENV == "production":
         processors.extend([
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+            if orjson is not None else structlog.processors.JSONRenderer()
         ])
     else:
         processors.extend([
@@ -124,6 +133,34 @@ def get_logger(module_name: str) -> structlog.BoundLogger:
         version="1.0.0"
     )
 
+def get_queue_listener() -> Optional[logging.handlers.QueueListener]:
+    """
+    Returns the listener that writes queued log records to the console.
+    
+    Returns:
+        Queue listener started by setup_logging, or None before logging is set up
+    """
+    return _queue_listener
+
+def _orjson_dumps(obj: dict, **kwargs) -> str:
+    """
+    Serializes a log event with orjson, returning str for stdlib handlers.
+    
+    Args:
+        obj: Event dictionary to serialize
+        **kwargs: Serializer options from JSONRenderer, e.g. the default fallback
+        
+    Returns:
+        JSON encoded event
+    """
+    # Non-str keys (ints, UUIDs, enums) are coerced to strings like json.dumps does
+    # instead of raising TypeError
+    return orjson.dumps(
+        obj,
+        default=kwargs.get("default"),
+        option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
 def _setup_queue_handler(log_queue: queue.Queue) -> logging.Handler:
     """
     Sets up an async queue handler for improved logging performance.
@@ -134,13 +171,14 @@ def _setup_queue_handler(log_queue: queue.Queue) -> logging.Handler:
     Returns:
         Configured queue handler
     """
+    global _queue_listener
     queue_handler = logging.handlers.QueueHandler(log_queue)
-    queue_listener = logging.handlers.QueueListener(
+    _queue_listener = logging.handlers.QueueListener(
         log_queue,
         _setup_console_handler(),
         respect_handler_level=True
     )
-    queue_listener.start()
+    _queue_listener.start()
     return queue_handler
 
 def _setup_console_handler() -> logging.Handler:
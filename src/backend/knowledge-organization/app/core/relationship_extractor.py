@@ -273,6 +273,49 @@ class RelationshipExtractor:
             )
             raise
 
+    def calculate_relationship_weights_batch(
+        self,
+        relationship_types: List[str],
+        similarity_scores: np.ndarray,
+        source_qualities: np.ndarray,
+        target_qualities: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized counterpart of calculate_relationship_weight for many relationships.
+
+        Args:
+            relationship_types: Relationship type per entry
+            similarity_scores: Similarity score per entry
+            source_qualities: Source node quality per entry
+            target_qualities: Target node quality per entry
+
+        Returns:
+            Array of normalized relationship weights
+        """
+        try:
+            base_weights = np.fromiter(
+                (RELATIONSHIP_WEIGHTS.get(t, 0.5) for t in relationship_types),
+                dtype=np.float32,
+                count=len(relationship_types)
+            )
+            
+            # base * similarity * mean(source_quality, target_quality)
+            weights = base_weights * np.asarray(similarity_scores, dtype=np.float32)
+            weights *= 0.5 * (
+                np.asarray(source_qualities, dtype=np.float32) +
+                np.asarray(target_qualities, dtype=np.float32)
+            )
+            
+            # Normalize weights to [0,1] range
+            return np.clip(weights, 0.0, 1.0, out=weights)
+
+        except Exception as e:
+            logger.error(
+                f"Batch weight calculation failed: {str(e)}",
+                extra={"relationships_count": len(relationship_types)}
+            )
+            raise
+
     def filter_relationships(
         self,
         relationships: List[Relationship],
@@ -18,7 +18,7 @@ import threading
 from typing import Dict
 from prometheus_client import Counter, Histogram
 
-from .embedding_generator import EmbeddingGenerator
+from .embedding_generator import EmbeddingGenerator, EmbeddingBatch
 from .similarity_calculator import SimilarityCalculator
 from .vector_indexer import VectorIndexer
 
@@ -28,6 +28,7 @@ __version__ = "1.0.0"
 # Define exports
 __all__ = [
     "EmbeddingGenerator",
+    "EmbeddingBatch",
     "SimilarityCalculator", 
     "VectorIndexer",
     "health_check",
@@ -17,10 +17,10 @@ import numpy as np
 import torch
 from transformers import AutoModel, AutoTokenizer
 import tenacity
-from typing import List, Tuple, Dict, Optional
+from typing import List, NamedTuple, Tuple, Dict, Optional
 import uuid
 import gc
-from time import perf_counter
+from time import perf_counter, perf_counter_ns
 
 from ..models.embedding import Embedding
 from ..config import load_settings
@@ -31,6 +31,28 @@ DEFAULT_MODEL = "sentence-transformers/all-mpnet-base-v2"
 DEFAULT_BATCH_SIZE = 32
 MAX_MEMORY_MB = 8192
 QUALITY_THRESHOLD = 0.8
+SUPPORTED_PRECISIONS = ("fp32", "fp16", "bf16")
+
+class EmbeddingBatch(NamedTuple):
+    """
+    Struct-of-arrays result of batch embedding generation.
+    
+    Attributes:
+        vectors (np.ndarray): Contiguous (N, dimension) float32 matrix, one row per item
+        quality_scores (np.ndarray): (N,) float32 quality scores
+        content_ids (List[uuid.UUID]): Content identifiers in input order
+        metadata (List[Dict]): Metadata dictionaries in input order
+        tensors (Optional[torch.Tensor]): Device-resident (N, dimension) float32 copy of
+            vectors, populated only when requested
+        timings (Optional[np.ndarray]): (N,) per-item processing time in seconds, the
+            owning sub-batch's duration divided evenly; populated only when requested
+    """
+    vectors: np.ndarray
+    quality_scores: np.ndarray
+    content_ids: List[uuid.UUID]
+    metadata: List[Dict]
+    tensors: Optional[torch.Tensor] = None
+    timings: Optional[np.ndarray] = None
 
 class EmbeddingGenerator:
     """
@@ -43,7 +65,8 @@ class EmbeddingGenerator:
         model_name: str = DEFAULT_MODEL,
         batch_size: int = DEFAULT_BATCH_SIZE,
         use_gpu: bool = True,
-        max_memory_mb: int = MAX_MEMORY_MB
+        max_memory_mb: int = MAX_MEMORY_MB,
+        precision: str = "fp32"
     ) -> None:
         """
         Initialize the embedding generator with GPU support and resource management.
@@ -53,7 +76,12 @@ class EmbeddingGenerator:
             batch_size (int): Maximum batch size for processing
             use_gpu (bool): Enable GPU acceleration if available
             max_memory_mb (int): Maximum memory usage in MB
+            precision (str): Model weight precision on GPU ("fp32", "fp16" or "bf16");
+                CPU inference always runs in fp32 and output vectors are always fp32
         """
+        if precision not in SUPPORTED_PRECISIONS:
+            raise ValueError(f"Unsupported precision: {precision}")
+            
         self._device = torch.device("cuda" if use_gpu and torch.cuda.is_available() else "cpu")
         logger.info(f"Initializing EmbeddingGenerator with device: {self._device}")
         
@@ -63,6 +91,9 @@ class EmbeddingGenerator:
         
         # Move model to appropriate device
         self._model.to(self._device)
+        self._dtype = self._resolve_dtype(precision)
+        if self._dtype != torch.float32:
+            self._model.to(dtype=self._dtype)
         self._model.eval()  # Set to inference mode
         
         # Configure processing parameters
@@ -82,6 +113,7 @@ class EmbeddingGenerator:
             raise ValueError(
                 f"Model output dimension {output_dim} does not match configured dimension {settings.PINECONE_DIMENSION}"
             )
+        self._dimension = output_dim
             
         logger.info(
             "EmbeddingGenerator initialized successfully",
@@ -89,6 +121,7 @@ class EmbeddingGenerator:
                 "metadata": {
                     "model": model_name,
                     "device": str(self._device),
+                    "dtype": str(self._dtype),
                     "batch_size": batch_size,
                     "dimension": output_dim
                 }
@@ -145,12 +178,12 @@ class EmbeddingGenerator:
             )
             
             # Generate embedding with GPU acceleration
-            with torch.no_grad():
+            with torch.inference_mode():
                 tokens = {k: v.to(self._device) for k, v in tokens.items()}
                 model_output = self._model(**tokens)
                 
             # Extract and process embedding
-            embedding_tensor = model_output.last_hidden_state.mean(dim=1)
+            embedding_tensor = model_output.last_hidden_state.float().mean(dim=1)
             embedding_np = embedding_tensor.cpu().numpy().squeeze()
             
             # Normalize vector
@@ -193,41 +226,80 @@ class EmbeddingGenerator:
 
     def generate_batch_embeddings(
         self,
-        content_batch: List[Tuple[str, uuid.UUID, float, Dict]]
-    ) -> List[Embedding]:
+        content_batch: List[Tuple[str, uuid.UUID, float, Dict]],
+        return_tensors: bool = False,
+        per_item_timing: bool = False
+    ) -> EmbeddingBatch:
         """
         Optimized batch processing with memory management.
         
         Args:
             content_batch: List of (content, content_id, quality_score, metadata) tuples
+            return_tensors: Also keep the vectors as a tensor on the model device so
+                callers can run similarity math without a host round trip
+            per_item_timing: Record per-item processing time for each sub-batch
             
         Returns:
-            List[Embedding]: Batch of quality-controlled embeddings
+            EmbeddingBatch: Batch of quality-controlled embeddings with vectors stacked
+            into one contiguous (N, dimension) float32 matrix
         """
         start_time = perf_counter()
-        results = []
+        batch_count = len(content_batch)
+        vectors = np.empty((batch_count, self._dimension), dtype=np.float32)
+        quality_scores = np.empty(batch_count, dtype=np.float32)
+        tensors = (
+            torch.empty((batch_count, self._dimension), dtype=torch.float32, device=self._device)
+            if return_tensors else None
+        )
+        timings = np.empty(batch_count, dtype=np.float64) if per_item_timing else None
         
         # Validate batch size
-        if len(content_batch) > self._batch_size:
-            logger.warning(f"Batch size {len(content_batch)} exceeds maximum {self._batch_size}")
+        if batch_count > self._batch_size:
+            logger.warning(f"Batch size {batch_count} exceeds maximum {self._batch_size}")
             
         try:
             # Process in optimal sub-batches
-            for i in range(0, len(content_batch), self._batch_size):
+            for i in range(0, batch_count, self._batch_size):
                 sub_batch = content_batch[i:i + self._batch_size]
+                sub_start_ns = perf_counter_ns()
                 
-                # Generate embeddings for sub-batch
-                sub_results = []
-                for content, content_id, quality_score, metadata in sub_batch:
-                    embedding = self.generate_embedding(
-                        content,
-                        content_id,
-                        quality_score,
-                        metadata
+                # Resolve cache hits and collect misses for a single forward pass
+                pending = []
+                for row, (content, content_id, quality_score, metadata) in enumerate(sub_batch, start=i):
+                    if not content or not isinstance(content, str):
+                        raise ValueError("Content must be a non-empty string")
+                        
+                    quality_scores[row] = quality_score
+                    cached = self._cache.get(str(content_id))
+                    if cached is not None:
+                        vectors[row] = cached.vector
+                        if tensors is not None:
+                            tensors[row] = torch.from_numpy(cached.vector)
+                        continue
+                        
+                    pending.append((row, content, content_id, quality_score, metadata))
+                
+                if pending:
+                    rows = [item[0] for item in pending]
+                    encoded = self._encode_batch([item[1] for item in pending])
+                    vectors[rows] = encoded.cpu().numpy()
+                    if tensors is not None:
+                        tensors[rows] = encoded
+                    for row, _, content_id, quality_score, metadata in pending:
+                        # Copy the row so callers editing the returned matrix can't
+                        # corrupt the cache, and the cache doesn't pin the whole batch
+                        embedding = Embedding(
+                            vector=vectors[row].copy(),
+                            content_id=content_id,
+                            quality_score=quality_score,
+                            metadata=metadata
+                        )
+                        self._update_cache(str(content_id), embedding)
+                
+                if timings is not None:
+                    timings[i:i + len(sub_batch)] = (
+                        (perf_counter_ns() - sub_start_ns) / 1e9 / len(sub_batch)
                     )
-                    sub_results.append(embedding)
-                    
-                results.extend(sub_results)
                 
                 # Memory management
                 if i % (self._batch_size * 2) == 0:
@@ -236,17 +308,24 @@ class EmbeddingGenerator:
             # Log batch performance
             processing_time = perf_counter() - start_time
             logger.info(
-                f"Processed batch of {len(content_batch)} items",
+                f"Processed batch of {batch_count} items",
                 extra={
                     "performance_metrics": {
-                        "batch_size": len(content_batch),
+                        "batch_size": batch_count,
                         "processing_time": processing_time,
-                        "average_time_per_item": processing_time / len(content_batch)
+                        "average_time_per_item": processing_time / batch_count
                     }
                 }
             )
             
-            return results
+            return EmbeddingBatch(
+                vectors=vectors,
+                quality_scores=quality_scores,
+                content_ids=[item[1] for item in content_batch],
+                metadata=[item[3] for item in content_batch],
+                tensors=tensors,
+                timings=timings
+            )
             
         except Exception as e:
             logger.error(
@@ -255,6 +334,48 @@ class EmbeddingGenerator:
             )
             raise RuntimeError(f"Batch processing failed: {str(e)}")
 
+    def _encode_batch(self, contents: List[str]) -> torch.Tensor:
+        """
+        Encode several contents with one tokenizer call and one model forward pass.
+        
+        Args:
+            contents: Input texts
+            
+        Returns:
+            torch.Tensor: (len(contents), dimension) float32 unit-norm vectors on the model device
+        """
+        tokens = self._tokenizer(
+            contents,
+            padding=True,
+            truncation=True,
+            max_length=512,
+            return_tensors="pt"
+        )
+        
+        with torch.inference_mode():
+            tokens = {k: v.to(self._device) for k, v in tokens.items()}
+            model_output = self._model(**tokens)
+            
+        # Mean-pool over real tokens only so padding does not skew shorter inputs
+        hidden_state = model_output.last_hidden_state.float()
+        mask = tokens["attention_mask"].unsqueeze(-1).to(hidden_state.dtype)
+        summed = (hidden_state * mask).sum(dim=1)
+        embeddings = summed / mask.sum(dim=1).clamp(min=1)
+        
+        # Normalize vectors
+        return torch.nn.functional.normalize(embeddings, dim=1)
+
+    def _resolve_dtype(self, precision: str) -> torch.dtype:
+        """Map requested precision to a model dtype supported by the active device."""
+        if self._device.type != "cuda" or precision == "fp32":
+            return torch.float32
+            
+        if precision == "bf16" and not torch.cuda.is_bf16_supported():
+            logger.warning("bf16 not supported on this GPU, falling back to fp16")
+            return torch.float16
+            
+        return torch.bfloat16 if precision == "bf16" else torch.float16
+
     def _update_cache(self, key: str, embedding: Embedding) -> None:
         """Update cache with memory management."""
         embedding_size = embedding.vector.nbytes
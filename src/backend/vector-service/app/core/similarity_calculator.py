@@ -162,6 +162,175 @@ class SimilarityCalculator:
                 )
                 raise
 
+    def calculate_similarity_batch(
+        self,
+        vectors1: np.ndarray,
+        vectors2: np.ndarray,
+        norms1: Optional[np.ndarray] = None,
+        norms2: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Calculate row-wise similarity between two stacked vector arrays in one pass.
+        Applies the same normalization, clipping and threshold as calculate_similarity.
+
+        Args:
+            vectors1: Array of shape (N, D) holding first vectors
+            vectors2: Array of shape (N, D) holding second vectors
+            norms1: Optional precomputed L2 norms of vectors1 rows
+            norms2: Optional precomputed L2 norms of vectors2 rows
+
+        Returns:
+            np.ndarray: Similarity score per row pair
+
+        Raises:
+            ValueError: If array shapes don't match
+            TypeError: If inputs are not numpy arrays
+        """
+        try:
+            # Input validation
+            if not isinstance(vectors1, np.ndarray) or not isinstance(vectors2, np.ndarray):
+                raise TypeError("Inputs must be numpy arrays")
+
+            if vectors1.ndim != 2 or vectors1.shape != vectors2.shape:
+                raise ValueError("Vector arrays must be 2D with matching shapes")
+
+            if vectors1.shape[1] > MAX_VECTOR_DIMENSION:
+                raise ValueError(f"Vector dimension exceeds maximum: {MAX_VECTOR_DIMENSION}")
+
+            for norms in (norms1, norms2):
+                if norms is not None and norms.shape != vectors1.shape[:1]:
+                    raise ValueError("Precomputed norms must hold one value per row")
+
+            # Row reductions accumulate in at least float32 so integer input can't overflow
+            dtype = np.result_type(vectors1, vectors2, np.float32)
+            if norms1 is None:
+                norms1 = np.sqrt(np.einsum("ij,ij->i", vectors1, vectors1, dtype=dtype))
+            if norms2 is None:
+                norms2 = np.sqrt(np.einsum("ij,ij->i", vectors2, vectors2, dtype=dtype))
+
+            # Calculate similarity based on metric
+            if self._metric in ("cosine", "dot_product"):
+                # Dividing the raw dots avoids materializing normalized copies
+                dots = np.einsum("ij,ij->i", vectors1, vectors2, dtype=dtype)
+                scores = dots / (norms1 * norms2)
+            else:
+                vectors1_norm = vectors1 / norms1[:, None]
+                vectors2_norm = vectors2 / norms2[:, None]
+                if self._metric == "euclidean":
+                    scores = 1 / (1 + np.linalg.norm(vectors1_norm - vectors2_norm, axis=1))
+                else:  # manhattan
+                    scores = 1 / (1 + np.abs(vectors1_norm - vectors2_norm).sum(axis=1))
+
+            # Apply threshold
+            scores = np.clip(scores, 0.0, 1.0)
+            scores[scores < self._threshold] = 0.0
+
+            logger.debug(
+                "Calculated batch vector similarity",
+                extra={
+                    "metric": self._metric,
+                    "pair_count": vectors1.shape[0],
+                    "vector_dim": vectors1.shape[1]
+                }
+            )
+
+            return scores
+
+        except Exception as e:
+            logger.error(
+                f"Batch similarity calculation failed: {str(e)}",
+                extra={"error_type": type(e).__name__}
+            )
+            raise
+
+    def calculate_similarity_matrix(
+        self,
+        queries: np.ndarray,
+        corpus: np.ndarray,
+        query_norms: Optional[np.ndarray] = None,
+        corpus_norms: Optional[np.ndarray] = None,
+        apply_threshold: bool = True
+    ) -> np.ndarray:
+        """
+        Calculate similarity of every query row against every corpus row.
+        Cosine, dot product and euclidean scores come from a single matrix product.
+
+        Args:
+            queries: Array of shape (Q, D) holding query vectors
+            corpus: Array of shape (N, D) holding corpus vectors
+            query_norms: Optional precomputed L2 norms of query rows
+            corpus_norms: Optional precomputed L2 norms of corpus rows
+            apply_threshold: Whether to zero scores below the configured threshold
+
+        Returns:
+            np.ndarray: Similarity scores of shape (Q, N)
+
+        Raises:
+            ValueError: If array shapes don't match
+            TypeError: If inputs are not numpy arrays
+        """
+        try:
+            # Input validation
+            if not isinstance(queries, np.ndarray) or not isinstance(corpus, np.ndarray):
+                raise TypeError("Inputs must be numpy arrays")
+
+            if queries.ndim != 2 or corpus.ndim != 2 or queries.shape[1] != corpus.shape[1]:
+                raise ValueError("Vector arrays must be 2D with matching dimensions")
+
+            if queries.shape[1] > MAX_VECTOR_DIMENSION:
+                raise ValueError(f"Vector dimension exceeds maximum: {MAX_VECTOR_DIMENSION}")
+
+            for norms, vectors in ((query_norms, queries), (corpus_norms, corpus)):
+                if norms is not None and norms.shape != vectors.shape[:1]:
+                    raise ValueError("Precomputed norms must hold one value per row")
+
+            dtype = np.result_type(queries, corpus, np.float32)
+            if query_norms is None:
+                query_norms = np.sqrt(np.einsum("ij,ij->i", queries, queries, dtype=dtype))
+            if corpus_norms is None:
+                corpus_norms = np.sqrt(np.einsum("ij,ij->i", corpus, corpus, dtype=dtype))
+
+            # Calculate similarity based on metric
+            if self._metric == "manhattan":
+                queries_norm = queries / query_norms[:, None]
+                corpus_norm = corpus / corpus_norms[:, None]
+                scores = np.empty((queries.shape[0], corpus.shape[0]), dtype=dtype)
+                for row, query in enumerate(queries_norm):
+                    scores[row] = 1 / (1 + np.abs(corpus_norm - query).sum(axis=1))
+            else:
+                # Cast first so integer input can't overflow in the product
+                scores = np.matmul(
+                    queries.astype(dtype, copy=False),
+                    corpus.astype(dtype, copy=False).T
+                )
+                scores /= query_norms[:, None] * corpus_norms[None, :]
+                if self._metric == "euclidean":
+                    # Distance between unit vectors follows from their cosine
+                    scores = 1 / (1 + np.sqrt(np.maximum(2 - 2 * scores, 0)))
+
+            # Apply threshold
+            scores = np.clip(scores, 0.0, 1.0)
+            if apply_threshold:
+                scores[scores < self._threshold] = 0.0
+
+            logger.debug(
+                "Calculated vector similarity matrix",
+                extra={
+                    "metric": self._metric,
+                    "query_count": queries.shape[0],
+                    "corpus_size": corpus.shape[0]
+                }
+            )
+
+            return scores
+
+        except Exception as e:
+            logger.error(
+                f"Similarity matrix calculation failed: {str(e)}",
+                extra={"error_type": type(e).__name__}
+            )
+            raise
+
     async def find_similar_vectors(
         self,
         query_vector: np.ndarray,
@@ -227,54 +396,52 @@ class SimilarityCalculator:
 
     def batch_similarity(
         self,
-        vector_pairs: List[Tuple[np.ndarray, np.ndarray]],
-        batch_size: int = MAX_BATCH_SIZE
+        vectors1: np.ndarray,
+        vectors2: np.ndarray,
+        batch_size: int = MAX_BATCH_SIZE,
+        norms1: Optional[np.ndarray] = None,
+        norms2: Optional[np.ndarray] = None
     ) -> np.ndarray:
         """
-        Process batch similarity calculations in parallel.
+        Process batch similarity calculations over row-aligned vector arrays.
 
         Args:
-            vector_pairs: List of vector pairs to compare
-            batch_size: Size of processing batches
+            vectors1: Array of shape (N, D) holding the first vector of each pair
+            vectors2: Array of shape (N, D) holding the second vector of each pair
+            batch_size: Number of pairs scored per pass
+            norms1: Optional precomputed L2 norms of vectors1 rows
+            norms2: Optional precomputed L2 norms of vectors2 rows
 
         Returns:
             Array of similarity scores
         """
         try:
-            if not vector_pairs:
+            if len(vectors1) == 0:
                 return np.array([])
                 
             if batch_size > MAX_BATCH_SIZE:
                 batch_size = MAX_BATCH_SIZE
             
-            # Split into batches
-            batches = [
-                vector_pairs[i:i + batch_size]
-                for i in range(0, len(vector_pairs), batch_size)
+            # Each batch is one vectorized pass over a slice of rows
+            scores = [
+                self._process_batch(
+                    vectors1[i:i + batch_size],
+                    vectors2[i:i + batch_size],
+                    None if norms1 is None else norms1[i:i + batch_size],
+                    None if norms2 is None else norms2[i:i + batch_size]
+                )
+                for i in range(0, len(vectors1), batch_size)
             ]
             
-            # Process batches in parallel
-            scores = []
-            with ThreadPoolExecutor(max_workers=len(batches)) as executor:
-                futures = []
-                for batch in batches:
-                    future = executor.submit(self._process_batch, batch)
-                    futures.append(future)
-                
-                # Collect results
-                for future in futures:
-                    batch_scores = future.result()
-                    scores.extend(batch_scores)
-            
             logger.info(
                 "Completed batch similarity processing",
                 extra={
-                    "total_pairs": len(vector_pairs),
-                    "batch_count": len(batches)
+                    "total_pairs": len(vectors1),
+                    "batch_count": len(scores)
                 }
             )
             
-            return np.array(scores)
+            return np.concatenate(scores)
             
         except Exception as e:
             logger.error(
@@ -285,10 +452,10 @@ class SimilarityCalculator:
 
     def _process_batch(
         self,
-        batch: List[Tuple[np.ndarray, np.ndarray]]
-    ) -> List[float]:
-        """Process a single batch of vector pairs."""
-        return [
-            self.calculate_similarity(vec1, vec2)
-            for vec1, vec2 in batch
-        ]
\ No newline at end of file
+        vectors1: np.ndarray,
+        vectors2: np.ndarray,
+        norms1: Optional[np.ndarray] = None,
+        norms2: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Process a single batch of row-aligned vector pairs."""
+        return self.calculate_similarity_batch(vectors1, vectors2, norms1, norms2)
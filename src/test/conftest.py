@@ -5,8 +5,11 @@ with enhanced security, monitoring, and resource management capabilities.
 Version: 1.0.0
 """
 
+import asyncio
 import os
+import sys
 import pytest
+import pytest_asyncio
 from typing import Dict, Any, Optional
 import mongomock
 import redis
@@ -16,7 +19,14 @@ from unittest.mock import AsyncMock, MagicMock
 from .utils.python.test_helpers import TestBase, load_test_data
 from .utils.python.mock_factory import MockFactory
 from .utils.python.data_generators import TestDataGenerator
-from .utils.python.test_logger import configure_test_logger
+from .utils.python.test_logger import (
+    configure_test_logger,
+    flush_log_streams,
+    session_assertion_summary,
+    start_log_queue,
+    stop_log_queue
+)
+from .utils.python.test_client import build_pooled_client, close_test_clients
 
 # Global test configuration constants
 TEST_ENV = "test"
@@ -65,10 +75,58 @@ def pytest_configure(config):
         "monitoring_config": MONITORING_CONFIG
     })
 
-@pytest.fixture
-def mock_factory() -> MockFactory:
+def pytest_sessionstart(session):
     """
-    Enhanced fixture providing MockFactory instance with monitoring and caching.
+    Batches console output of the service log listener once logging is configured.
+
+    Args:
+        session: Pytest session object
+    """
+    start_log_queue()
+
+def pytest_runtest_logfinish(nodeid, location):
+    """
+    Writes out buffered log output at each test boundary so logs stay close to live.
+
+    Args:
+        nodeid: Node id of the finished test
+        location: File, line and name of the finished test
+    """
+    flush_log_streams()
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Flushes queued log records before pytest reports the session result.
+
+    Args:
+        session: Pytest session object
+        exitstatus: Session exit status
+    """
+    stop_log_queue()
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """
+    Reports assertion counts and timing aggregated across the session.
+
+    Args:
+        terminalreporter: Pytest terminal reporter
+        exitstatus: Session exit status
+        config: Pytest config object
+    """
+    summary = session_assertion_summary()
+    if not summary["total"]:
+        return
+    terminalreporter.write_sep("-", "assertion metrics")
+    terminalreporter.write_line(
+        f"{summary['total']} assertions ({summary['passed']} passed, "
+        f"{summary['failed']} failed), avg {summary['avg_ms']:.1f} ms, "
+        f"max {summary['max_ms']:.1f} ms"
+    )
+
+@pytest.fixture(scope="session")
+def _session_mock_factory() -> MockFactory:
+    """
+    Builds the shared MockFactory once per session so fixture files are read only once.
 
     Returns:
         Configured mock factory instance with monitoring
@@ -98,10 +156,53 @@ def mock_factory() -> MockFactory:
     
     # Initialize factory with configurations
     factory._test_data.update(test_data)
-    factory._mock_cache.clear()
     
     return factory
 
+@pytest.fixture
+def mock_factory(_session_mock_factory: MockFactory) -> MockFactory:
+    """
+    Enhanced fixture providing MockFactory instance with monitoring and caching.
+
+    Returns:
+        Session mock factory with its mock cache reset for the current test
+    """
+    # Tests may patch methods on cached stubs, so hand each test fresh mocks
+    _session_mock_factory._mock_cache.clear()
+    
+    return _session_mock_factory
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """
+    Session-wide event loop so session-scoped async fixtures outlive single tests.
+
+    Yields:
+        Event loop shared by the whole test session
+    """
+    loop = asyncio.new_event_loop()
+    # Start tasks eagerly so short gathered requests skip an event loop iteration
+    if sys.version_info >= (3, 12):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    yield loop
+    # Memoized test clients live for the whole session and close on its loop
+    loop.run_until_complete(close_test_clients())
+    loop.close()
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client():
+    """
+    Session-scoped pooled HTTP client shared by every TestClient.
+
+    Yields:
+        Pooled async HTTP client, closed once at session end
+    """
+    client = build_pooled_client()
+    try:
+        yield client
+    finally:
+        await client.aclose()
+
 @pytest.fixture
 def test_data_generator() -> TestDataGenerator:
     """
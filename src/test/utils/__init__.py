@@ -31,12 +31,9 @@ __all__ = [
     "MockFactory"
 ]
 
-# Initialize test logger
-logger = setup_test_logger(
-    test_name="test_utils",
-    log_level="INFO",
-    test_suite_context={"package": __name__}
-)
+# Share the logger configured by the .python subpackage
+from .python import get_test_logger as _get_python_test_logger
+logger = _get_python_test_logger()
 
 def get_version() -> str:
     """Returns the package version."""
@@ -46,33 +43,4 @@ def get_test_logger():
     """Returns the configured test logger instance."""
     return logger
 
-# Validate environment on import
-try:
-    # Initialize test environment
-    from .python import setup_test_environment
-    setup_test_environment(
-        environment="test",
-        secure_mode=True
-    )
-    
-    # Log successful initialization
-    logger.log_assertion(
-        "package_initialization",
-        passed=True,
-        context={
-            "version": __version__,
-            "environment": "test"
-        }
-    )
-
-except Exception as e:
-    # Log initialization failure
-    logger.log_assertion(
-        "package_initialization",
-        passed=False,
-        context={
-            "error": str(e),
-            "version": __version__
-        }
-    )
-    raise
\ No newline at end of file
+# Environment validation runs once when the .python subpackage is first imported
@@ -6,14 +6,196 @@ with support for async operations, monitoring integration, and enhanced caching.
 Version: 1.0.0
 """
 
+import asyncio
 import time
-from typing import Dict, Optional, Any
-from unittest.mock import Mock, AsyncMock, MagicMock
+from datetime import timedelta
+from typing import Dict, Hashable, Optional, Any
 import pytest  # v7.0.0
 
 from .test_helpers import load_test_data
 from .test_logger import TestLogger
 
+def _freeze(value: Any) -> Hashable:
+    """
+    Recursively converts dicts, lists and sets into hashable equivalents for cache keys.
+
+    Containers are tagged with their kind and scalars with their type, so values that
+    compare equal across types (1, 1.0 and True) or a dict and its item pairs freeze
+    to different keys.
+
+    Raises:
+        TypeError: If a leaf value is unhashable
+    """
+    if isinstance(value, dict):
+        items = sorted(value.items(), key=lambda item: (type(item[0]).__name__, repr(item[0])))
+        return ("dict", tuple((_freeze(key), _freeze(item)) for key, item in items))
+    if isinstance(value, list):
+        return ("list", tuple(_freeze(item) for item in value))
+    if isinstance(value, tuple):
+        return ("tuple", tuple(_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return ("set", frozenset(_freeze(item) for item in value))
+    hash(value)
+    return (type(value), value)
+
+def _cache_key(*parts: Any) -> Optional[Hashable]:
+    """Builds a mock cache key, or None when some part can't be frozen and caching is skipped."""
+    try:
+        return _freeze(parts)
+    except TypeError:
+        return None
+
+class _YouTubeServiceStub:
+    """Plain-class stand-in for YouTubeService exposing only the methods tests call."""
+
+    def __init__(
+        self,
+        logger: TestLogger,
+        test_responses: Optional[Dict[str, Any]],
+        error_scenarios: Optional[Dict[str, Any]]
+    ) -> None:
+        self._logger = logger
+        self._responses = test_responses or {}
+        self._errors = error_scenarios or {}
+        self._rate_limit_reset = time.time() + 3600
+
+    async def search_videos(self, *args, **kwargs) -> Dict[str, Any]:
+        if self._logger._enabled:
+            self._logger.log_assertion(
+                "youtube_search_called",
+                passed=True,
+                context={"args": args, "kwargs": kwargs}
+            )
+        
+        if "search_error" in self._errors:
+            raise self._errors["search_error"]
+            
+        return self._responses.get("search_videos", {
+            "items": [],
+            "nextPageToken": None
+        })
+
+    async def get_video_details(self, *args, **kwargs) -> Dict[str, Any]:
+        if self._logger._enabled:
+            self._logger.log_assertion(
+                "youtube_details_called",
+                passed=True,
+                context={"args": args, "kwargs": kwargs}
+            )
+        
+        if "details_error" in self._errors:
+            raise self._errors["details_error"]
+            
+        return self._responses.get("video_details", {
+            "id": "test_video_id",
+            "snippet": {"title": "Test Video"}
+        })
+
+    def rate_limit_remaining(self) -> int:
+        return 100
+
+    def rate_limit_reset(self) -> float:
+        return self._rate_limit_reset
+
+class _SpotifyServiceStub:
+    """Plain-class stand-in for SpotifyService with auth simulation."""
+
+    def __init__(
+        self,
+        logger: TestLogger,
+        test_responses: Optional[Dict[str, Any]],
+        auth_config: Optional[Dict[str, Any]]
+    ) -> None:
+        self._logger = logger
+        self._responses = test_responses or {}
+        self._auth_config = auth_config
+
+    async def authenticate(self) -> Dict[str, Any]:
+        if self._logger._enabled:
+            self._logger.log_assertion(
+                "spotify_auth_called",
+                passed=True,
+                context={"auth_config": self._auth_config}
+            )
+        
+        if self._auth_config and "auth_error" in self._auth_config:
+            raise self._auth_config["auth_error"]
+            
+        return {
+            "access_token": "mock_access_token",
+            "expires_in": 3600
+        }
+
+    async def search_podcasts(self, *args, **kwargs) -> Dict[str, Any]:
+        if self._logger._enabled:
+            self._logger.log_assertion(
+                "spotify_search_called",
+                passed=True,
+                context={"args": args, "kwargs": kwargs}
+            )
+        
+        return self._responses.get("search_podcasts", {
+            "items": [],
+            "next": None
+        })
+
+    async def get_episode_details(self, *args, **kwargs) -> Dict[str, Any]:
+        if self._logger._enabled:
+            self._logger.log_assertion(
+                "spotify_details_called",
+                passed=True,
+                context={"args": args, "kwargs": kwargs}
+            )
+        
+        return self._responses.get("episode_details", {
+            "id": "test_episode_id",
+            "name": "Test Episode"
+        })
+
+class _ApiResponseStub:
+    """Minimal synchronous HTTP response with the attributes tests read."""
+
+    def __init__(
+        self,
+        status_code: int,
+        response_data: Dict[str, Any],
+        headers: Optional[Dict[str, str]]
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.elapsed = timedelta(seconds=0.1)
+        self._data = response_data
+
+    def json(self) -> Dict[str, Any]:
+        return self._data
+
+class _AsyncResponseStub:
+    """Minimal async HTTP response usable as an async context manager."""
+
+    def __init__(self, status_code: int, response_data: Dict[str, Any]) -> None:
+        self.status = status_code
+        self._data = response_data
+
+    async def json(self) -> Dict[str, Any]:
+        return self._data
+
+    async def __aenter__(self) -> "_AsyncResponseStub":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+class _DelayedAsyncResponseStub(_AsyncResponseStub):
+    """Async response stub that sleeps on entry to simulate network latency."""
+
+    def __init__(self, status_code: int, response_data: Dict[str, Any], delay: float) -> None:
+        super().__init__(status_code, response_data)
+        self._delay = delay
+
+    async def __aenter__(self) -> "_DelayedAsyncResponseStub":
+        await asyncio.sleep(self._delay)
+        return self
+
 class MockFactory:
     """
     Factory class for creating standardized mock objects for testing with enhanced
@@ -29,7 +211,7 @@ class MockFactory:
         """
         # Initialize test data and caching
         self._test_data: Dict[str, Any] = {}
-        self._mock_cache: Dict[str, Mock] = {}
+        self._mock_cache: Dict[Hashable, Any] = {}
         self._logger = TestLogger(
             test_name="mock_factory",
             log_level="INFO",
@@ -47,7 +229,7 @@ class MockFactory:
         self,
         test_responses: Optional[Dict[str, Any]] = None,
         error_scenarios: Optional[Dict[str, Any]] = None
-    ) -> Mock:
+    ) -> _YouTubeServiceStub:
         """
         Creates a mock YouTubeService instance with configurable responses and monitoring.
 
@@ -56,66 +238,26 @@ class MockFactory:
             error_scenarios: Optional dictionary of error scenarios
 
         Returns:
-            Mock YouTubeService instance with configured behaviors
+            Stub YouTubeService instance with configured behaviors
         """
-        mock_service = MagicMock()
-        cache_key = "youtube_service"
+        cache_key = _cache_key("youtube_service", test_responses, error_scenarios)
 
         # Return cached mock if available
-        if cache_key in self._mock_cache:
+        if cache_key is not None and cache_key in self._mock_cache:
             return self._mock_cache[cache_key]
 
-        # Configure search_videos method
-        async def mock_search_videos(*args, **kwargs):
-            self._logger.log_assertion(
-                "youtube_search_called",
-                passed=True,
-                context={"args": args, "kwargs": kwargs}
-            )
-            
-            if error_scenarios and "search_error" in error_scenarios:
-                raise error_scenarios["search_error"]
-                
-            response_data = (test_responses or {}).get("search_videos", {
-                "items": [],
-                "nextPageToken": None
-            })
-            return response_data
-
-        mock_service.search_videos = AsyncMock(side_effect=mock_search_videos)
-
-        # Configure get_video_details method
-        async def mock_get_video_details(*args, **kwargs):
-            self._logger.log_assertion(
-                "youtube_details_called",
-                passed=True,
-                context={"args": args, "kwargs": kwargs}
-            )
-            
-            if error_scenarios and "details_error" in error_scenarios:
-                raise error_scenarios["details_error"]
-                
-            response_data = (test_responses or {}).get("video_details", {
-                "id": "test_video_id",
-                "snippet": {"title": "Test Video"}
-            })
-            return response_data
-
-        mock_service.get_video_details = AsyncMock(side_effect=mock_get_video_details)
-
-        # Configure rate limiting simulation
-        mock_service.rate_limit_remaining = MagicMock(return_value=100)
-        mock_service.rate_limit_reset = MagicMock(return_value=time.time() + 3600)
-
-        # Cache the mock
-        self._mock_cache[cache_key] = mock_service
+        mock_service = _YouTubeServiceStub(self._logger, test_responses, error_scenarios)
+
+        # Cache the mock unless its configuration can't be keyed
+        if cache_key is not None:
+            self._mock_cache[cache_key] = mock_service
         return mock_service
 
     def create_spotify_service_mock(
         self,
         test_responses: Optional[Dict[str, Any]] = None,
         auth_config: Optional[Dict[str, Any]] = None
-    ) -> Mock:
+    ) -> _SpotifyServiceStub:
         """
         Creates a mock SpotifyService instance with auth simulation.
 
@@ -124,67 +266,19 @@ class MockFactory:
             auth_config: Optional authentication configuration
 
         Returns:
-            Mock SpotifyService instance with auth simulation
+            Stub SpotifyService instance with auth simulation
         """
-        mock_service = MagicMock()
-        cache_key = "spotify_service"
+        cache_key = _cache_key("spotify_service", test_responses, auth_config)
 
         # Return cached mock if available
-        if cache_key in self._mock_cache:
+        if cache_key is not None and cache_key in self._mock_cache:
             return self._mock_cache[cache_key]
 
-        # Configure authentication
-        async def mock_authenticate():
-            self._logger.log_assertion(
-                "spotify_auth_called",
-                passed=True,
-                context={"auth_config": auth_config}
-            )
-            
-            if auth_config and "auth_error" in auth_config:
-                raise auth_config["auth_error"]
-                
-            return {
-                "access_token": "mock_access_token",
-                "expires_in": 3600
-            }
-
-        mock_service.authenticate = AsyncMock(side_effect=mock_authenticate)
-
-        # Configure search_podcasts method
-        async def mock_search_podcasts(*args, **kwargs):
-            self._logger.log_assertion(
-                "spotify_search_called",
-                passed=True,
-                context={"args": args, "kwargs": kwargs}
-            )
-            
-            response_data = (test_responses or {}).get("search_podcasts", {
-                "items": [],
-                "next": None
-            })
-            return response_data
-
-        mock_service.search_podcasts = AsyncMock(side_effect=mock_search_podcasts)
-
-        # Configure get_episode_details method
-        async def mock_get_episode_details(*args, **kwargs):
-            self._logger.log_assertion(
-                "spotify_details_called",
-                passed=True,
-                context={"args": args, "kwargs": kwargs}
-            )
-            
-            response_data = (test_responses or {}).get("episode_details", {
-                "id": "test_episode_id",
-                "name": "Test Episode"
-            })
-            return response_data
-
-        mock_service.get_episode_details = AsyncMock(side_effect=mock_get_episode_details)
+        mock_service = _SpotifyServiceStub(self._logger, test_responses, auth_config)
 
-        # Cache the mock
-        self._mock_cache[cache_key] = mock_service
+        # Cache the mock unless its configuration can't be keyed
+        if cache_key is not None:
+            self._mock_cache[cache_key] = mock_service
         return mock_service
 
     def create_api_response_mock(
@@ -192,7 +286,7 @@ class MockFactory:
         status_code: int,
         response_data: Dict[str, Any],
         headers: Optional[Dict[str, str]] = None
-    ) -> Mock:
+    ) -> _ApiResponseStub:
         """
         Creates a mock HTTP response object with validation.
 
@@ -202,28 +296,30 @@ class MockFactory:
             headers: Optional response headers
 
         Returns:
-            Mock response object with headers and validation
+            Stub response object with headers and validation
         """
-        mock_response = MagicMock()
-        
-        # Configure response attributes
-        mock_response.status_code = status_code
-        mock_response.json.return_value = response_data
-        mock_response.headers = headers or {}
-        
-        # Add timing information
-        mock_response.elapsed.total_seconds.return_value = 0.1
+        cache_key = _cache_key("api_response", status_code, response_data, headers)
+
+        # Return cached mock if available
+        if cache_key is not None and cache_key in self._mock_cache:
+            return self._mock_cache[cache_key]
+
+        mock_response = _ApiResponseStub(status_code, response_data, headers)
         
         # Log response creation
-        self._logger.log_assertion(
-            "api_response_created",
-            passed=True,
-            context={
-                "status_code": status_code,
-                "headers": headers
-            }
-        )
+        if self._logger._enabled:
+            self._logger.log_assertion(
+                "api_response_created",
+                passed=True,
+                context={
+                    "status_code": status_code,
+                    "headers": headers
+                }
+            )
         
+        # Cache the mock unless its configuration can't be keyed
+        if cache_key is not None:
+            self._mock_cache[cache_key] = mock_response
         return mock_response
 
     @staticmethod
@@ -231,7 +327,7 @@ class MockFactory:
         status_code: int,
         response_data: Dict[str, Any],
         delay: Optional[float] = None
-    ) -> AsyncMock:
+    ) -> _AsyncResponseStub:
         """
         Creates a mock for async HTTP responses with context management.
 
@@ -241,24 +337,8 @@ class MockFactory:
             delay: Optional response delay in seconds
 
         Returns:
-            Async mock response object with delay simulation
+            Async stub response object with delay simulation
         """
-        mock_response = AsyncMock()
-        
-        # Configure response attributes
-        mock_response.status = status_code
-        mock_response.json = AsyncMock(return_value=response_data)
-        
-        # Configure context manager methods
-        async def mock_aenter(*args):
-            if delay:
-                await asyncio.sleep(delay)
-            return mock_response
-            
-        async def mock_aexit(*args):
-            pass
-            
-        mock_response.__aenter__ = AsyncMock(side_effect=mock_aenter)
-        mock_response.__aexit__ = AsyncMock(side_effect=mock_aexit)
-        
-        return mock_response
\ No newline at end of file
+        if delay:
+            return _DelayedAsyncResponseStub(status_code, response_data, delay)
+        return _AsyncResponseStub(status_code, response_data)
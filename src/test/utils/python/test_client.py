@@ -6,14 +6,37 @@ HTTP client functionality with comprehensive logging and security features.
 Version: 1.0.0
 """
 
+import asyncio
 import json
+import logging
+import os
 import contextlib
-from typing import Optional, Dict, Any, Generator, Union
+import functools
+import importlib
+import socket
+import ssl
+import time
+from time import perf_counter
+from typing import Optional, Dict, Any, Generator, List, Tuple, Union
 from urllib.parse import urljoin
 
+import certifi  # installed with httpx
+import httpcore  # v0.17.0
 import httpx  # v0.24.0
 import pytest  # v7.0.0
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+try:
+    import h2  # noqa: F401  # required by httpx for HTTP/2
+except ImportError:  # HTTP/2 support is optional
+    h2 = None
+
+HTTP2_AVAILABLE = h2 is not None
+
 from .test_logger import TestLogger, configure_test_logger
 from .test_helpers import TestBase
 
@@ -25,6 +48,283 @@ DEFAULT_HEADERS = {
     "X-Test-Client": "true"
 }
 SENSITIVE_HEADERS = ["Authorization", "Cookie", "X-API-Key"]
+SENSITIVE_HEADERS_LOWER = frozenset(header.lower() for header in SENSITIVE_HEADERS)
+POOL_LIMITS = {
+    "max_keepalive_connections": 100,
+    "max_connections": 200,
+    "keepalive_expiry": 60
+}
+DEFAULT_BULK_CONCURRENCY = 50
+MAX_LOGGED_BODY_BYTES = 4096  # response bodies are logged as truncated raw bytes
+DNS_CACHE_TTL = 15 * 60  # 15 minutes
+# Fast JSON decoder when available; both accept bytes and raise json.JSONDecodeError
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# httpx-compatible client libraries selectable via TEST_CLIENT_BACKEND
+CLIENT_BACKENDS = ("httpx", "httpxr", "requestx")
+
+@functools.lru_cache(maxsize=256)
+def _full_url(base_url: str, endpoint: str) -> str:
+    """
+    Joins an endpoint onto a base URL, keeping any path component of the base.
+
+    Args:
+        base_url: Base URL without trailing slash
+        endpoint: API endpoint path
+
+    Returns:
+        Absolute request URL
+    """
+    return urljoin(base_url + '/', endpoint.lstrip('/'))
+
+def _redact_request_body(data: Union[Dict, list]) -> Union[Dict, list]:
+    """
+    Copies a JSON-like body, redacting values whose key contains a sensitive word.
+
+    Walks the payload with an explicit stack instead of recursion, building the
+    copy as it goes.
+
+    Args:
+        data: Request body to redact
+
+    Returns:
+        Redacted copy of the body
+    """
+    if not isinstance(data, (dict, list)):
+        return data
+
+    root: Union[Dict, list] = {} if isinstance(data, dict) else []
+    stack = [(data, root)]
+    while stack:
+        source, target = stack.pop()
+        if isinstance(source, dict):
+            for k, v in source.items():
+                # Non-str keys are matched by their string form, as a JSON dump would show them
+                kl = k.lower() if isinstance(k, str) else str(k).lower()
+                if "password" in kl or "token" in kl or "secret" in kl or "key" in kl:
+                    target[k] = "[REDACTED]"
+                elif isinstance(v, dict):
+                    target[k] = child = {}
+                    stack.append((v, child))
+                elif isinstance(v, list):
+                    target[k] = child = []
+                    stack.append((v, child))
+                else:
+                    target[k] = v
+        else:
+            for item in source:
+                if isinstance(item, dict):
+                    child = {}
+                elif isinstance(item, list):
+                    child = []
+                else:
+                    target.append(item)
+                    continue
+                target.append(child)
+                stack.append((item, child))
+    return root
+
+def _load_client_backend() -> Any:
+    """
+    Resolves the httpx-compatible module named by the TEST_CLIENT_BACKEND variable.
+
+    Returns:
+        Client module exposing the httpx API, httpx itself by default
+
+    Raises:
+        ValueError: If the backend name is not supported
+    """
+    backend = os.environ.get("TEST_CLIENT_BACKEND", "httpx").lower()
+    if backend not in CLIENT_BACKENDS:
+        raise ValueError(f"Unsupported TEST_CLIENT_BACKEND: {backend}")
+    if backend == "httpx":
+        return httpx
+    return importlib.import_module(backend)
+
+class _CachingResolverBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that caches host resolution so new pooled connections skip
+    getaddrinfo. TLS still uses the original hostname for SNI and certificate checks.
+    """
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, ttl: float = DNS_CACHE_TTL) -> None:
+        self._backend = backend
+        self._ttl = ttl
+        self._addresses: Dict[Tuple[str, int], Tuple[List[str], float]] = {}
+        self._lock = asyncio.Lock()
+
+    async def _resolve(self, host: str, port: int) -> List[str]:
+        cached = self._addresses.get((host, port))
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+
+        async with self._lock:
+            # Another task may have resolved the host while we waited
+            cached = self._addresses.get((host, port))
+            if cached and cached[1] > time.monotonic():
+                return cached[0]
+
+            try:
+                infos = await asyncio.get_running_loop().getaddrinfo(
+                    host, port, type=socket.SOCK_STREAM
+                )
+            except OSError as e:
+                # Surface resolution failures as connect errors, as the stock backend does
+                raise httpcore.ConnectError(str(e)) from e
+            # Keep every address in getaddrinfo order so connects can fall back across families
+            addresses = list(dict.fromkeys(info[4][0] for info in infos))
+            self._addresses[(host, port)] = (addresses, time.monotonic() + self._ttl)
+            return addresses
+
+    async def connect_tcp(self, host: str, port: int, **kwargs: Any) -> httpcore.AsyncNetworkStream:
+        error: Optional[Exception] = None
+        for address in await self._resolve(host, port):
+            try:
+                return await self._backend.connect_tcp(address, port, **kwargs)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+        raise error or httpcore.ConnectError(f"No addresses found for {host}")
+
+    async def connect_unix_socket(self, path: str, **kwargs: Any) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, **kwargs)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+@contextlib.contextmanager
+def _map_httpcore_exceptions() -> Generator[None, None, None]:
+    """Re-raises httpcore errors as the httpx exception of the same name."""
+    try:
+        yield
+    except httpcore.TimeoutException as e:
+        raise getattr(httpx, type(e).__name__, httpx.TimeoutException)(str(e)) from e
+    except (httpcore.NetworkError, httpcore.ProtocolError, httpcore.UnsupportedProtocol) as e:
+        raise getattr(httpx, type(e).__name__, httpx.TransportError)(str(e)) from e
+
+class _PoolResponseStream(httpx.AsyncByteStream):
+    """Adapts an httpcore response stream to the httpx stream interface."""
+
+    def __init__(self, stream: Any) -> None:
+        self._stream = stream
+
+    async def __aiter__(self):
+        with _map_httpcore_exceptions():
+            async for part in self._stream:
+                yield part
+
+    async def aclose(self) -> None:
+        if hasattr(self._stream, "aclose"):
+            await self._stream.aclose()
+
+def _create_ssl_context(verify_ssl: bool) -> ssl.SSLContext:
+    """
+    Builds the TLS context for pooled connections the way httpx's default does: certifi
+    roots unless SSL_CERT_FILE or SSL_CERT_DIR is set, and ALPN offering h2 when enabled.
+
+    Args:
+        verify_ssl: SSL verification flag
+
+    Returns:
+        Client TLS context
+    """
+    cafile = os.environ.get("SSL_CERT_FILE")
+    capath = os.environ.get("SSL_CERT_DIR")
+    if cafile is None and capath is None:
+        cafile = certifi.where()
+    context = ssl.create_default_context(cafile=cafile, capath=capath)
+    if not verify_ssl:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    context.set_alpn_protocols(["http/1.1", "h2"] if HTTP2_AVAILABLE else ["http/1.1"])
+    return context
+
+class _CachingResolverTransport(httpx.AsyncBaseTransport):
+    """
+    Pooled transport whose connections resolve hosts through a TTL cache and multiplex
+    requests over HTTP/2 when the h2 package is installed. httpx 0.24 cannot hand a
+    network backend to its own transport, so the httpcore pool is built directly.
+    Environment proxies are still mounted by the client as separate transports.
+    """
+
+    def __init__(self, verify_ssl: bool) -> None:
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=_create_ssl_context(verify_ssl),
+            max_connections=POOL_LIMITS["max_connections"],
+            max_keepalive_connections=POOL_LIMITS["max_keepalive_connections"],
+            keepalive_expiry=POOL_LIMITS["keepalive_expiry"],
+            http2=HTTP2_AVAILABLE,
+            network_backend=_CachingResolverBackend(httpcore.AnyIOBackend())
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions
+        )
+        with _map_httpcore_exceptions():
+            core_response = await self._pool.handle_async_request(core_request)
+
+        return httpx.Response(
+            status_code=core_response.status,
+            headers=core_response.headers,
+            stream=_PoolResponseStream(core_response.stream),
+            extensions=core_response.extensions
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+def build_pooled_client(
+    timeout: Optional[float] = None,
+    verify_ssl: Optional[bool] = None
+) -> httpx.AsyncClient:
+    """
+    Builds a connection-pooled HTTP client meant to be shared across tests.
+
+    Args:
+        timeout: Optional default request timeout
+        verify_ssl: Optional SSL verification flag
+
+    Returns:
+        Pooled async HTTP client from the configured backend
+    """
+    backend = _load_client_backend()
+    verify = verify_ssl if verify_ssl is not None else True
+    if backend is httpx:
+        return httpx.AsyncClient(
+            timeout=timeout or DEFAULT_TIMEOUT,
+            transport=_CachingResolverTransport(verify),
+            follow_redirects=True
+        )
+    return backend.AsyncClient(
+        timeout=timeout or DEFAULT_TIMEOUT,
+        verify=verify,
+        limits=backend.Limits(**POOL_LIMITS),
+        follow_redirects=True
+    )
+
+class RequestMetrics:
+    """Request counters for a TestClient, stored in slots for cheap updates."""
+
+    __slots__ = ("requests", "successful_requests", "failed_requests", "total_response_time")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.successful_requests = 0
+        self.failed_requests = 0
+        self.total_response_time = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the counters as a dictionary for logging."""
+        return {name: getattr(self, name) for name in self.__slots__}
 
 class TestClient:
     """
@@ -38,7 +338,8 @@ class TestClient:
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
         verify_ssl: Optional[bool] = None,
-        logger_config: Optional[Dict] = None
+        logger_config: Optional[Dict] = None,
+        client: Optional[httpx.AsyncClient] = None
     ) -> None:
         """
         Initializes test client with enhanced configuration and security features.
@@ -49,6 +350,7 @@ class TestClient:
             timeout: Optional request timeout
             verify_ssl: Optional SSL verification flag
             logger_config: Optional logger configuration
+            client: Optional shared HTTP client; its owner is responsible for closing it
         """
         # Validate base URL
         if not base_url:
@@ -72,20 +374,13 @@ class TestClient:
         )
 
         # Initialize metrics tracking
-        self.metrics = {
-            "requests": 0,
-            "successful_requests": 0,
-            "failed_requests": 0,
-            "total_response_time": 0.0
-        }
+        self.reset_metrics()
 
-        # Initialize HTTP client with security settings
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers=self.headers,
+        # Reuse an injected pooled client, otherwise own a private one
+        self._owns_client = client is None
+        self._client = client or build_pooled_client(
             timeout=self.timeout,
-            verify=self.verify_ssl,
-            follow_redirects=True
+            verify_ssl=self.verify_ssl
         )
 
     async def get(
@@ -112,37 +407,42 @@ class TestClient:
             raise ValueError("Endpoint is required")
 
         # Prepare request
-        url = urljoin(self.base_url, endpoint.lstrip('/'))
+        url = _full_url(self.base_url, endpoint)
         request_headers = self._merge_headers(headers)
+        # Sanitizing and logging only pays off when the records are emitted
+        log_active = self.logger.is_enabled_for(logging.INFO)
         
         try:
             # Log sanitized request details
-            self.logger.log_request(
-                method="GET",
-                url=url,
-                headers=self._sanitize_headers(request_headers),
-                params=params
-            )
+            if log_active:
+                self.logger.log_request(
+                    method="GET",
+                    url=url,
+                    headers=self._sanitize_headers(request_headers),
+                    params=params
+                )
 
             # Make request with metrics tracking
-            start_time = pytest.helpers.time.time()
+            start_time = perf_counter()
             response = await self._client.get(
-                url=endpoint,
+                url=url,
                 params=params,
-                headers=request_headers
+                headers=request_headers,
+                timeout=self.timeout
             )
-            duration = pytest.helpers.time.time() - start_time
+            duration = perf_counter() - start_time
 
             # Update metrics
             self._update_metrics(response.status_code, duration)
 
             # Log sanitized response
-            self.logger.log_response(
-                status_code=response.status_code,
-                headers=self._sanitize_headers(dict(response.headers)),
-                body=response.text,
-                duration=duration
-            )
+            if log_active:
+                self.logger.log_response(
+                    status_code=response.status_code,
+                    headers=self._sanitize_headers(response.headers),
+                    body=response.content[:MAX_LOGGED_BODY_BYTES],
+                    duration=duration
+                )
 
             # Validate response if required
             if validate_schema:
@@ -151,7 +451,7 @@ class TestClient:
             return response
 
         except Exception as e:
-            self.metrics["failed_requests"] += 1
+            self.metrics.failed_requests += 1
             self.logger.log_error(
                 error=str(e),
                 context={
@@ -185,37 +485,42 @@ class TestClient:
             raise ValueError("Endpoint is required")
 
         # Prepare request
-        url = urljoin(self.base_url, endpoint.lstrip('/'))
+        url = _full_url(self.base_url, endpoint)
         request_headers = self._merge_headers(headers)
+        # Sanitizing and logging only pays off when the records are emitted
+        log_active = self.logger.is_enabled_for(logging.INFO)
         
         try:
             # Log sanitized request details
-            self.logger.log_request(
-                method="POST",
-                url=url,
-                headers=self._sanitize_headers(request_headers),
-                body=self._sanitize_request_body(json_data)
-            )
+            if log_active:
+                self.logger.log_request(
+                    method="POST",
+                    url=url,
+                    headers=self._sanitize_headers(request_headers),
+                    body=self._sanitize_request_body(json_data)
+                )
 
             # Make request with metrics tracking
-            start_time = pytest.helpers.time.time()
+            start_time = perf_counter()
             response = await self._client.post(
-                url=endpoint,
+                url=url,
                 json=json_data,
-                headers=request_headers
+                headers=request_headers,
+                timeout=self.timeout
             )
-            duration = pytest.helpers.time.time() - start_time
+            duration = perf_counter() - start_time
 
             # Update metrics
             self._update_metrics(response.status_code, duration)
 
             # Log sanitized response
-            self.logger.log_response(
-                status_code=response.status_code,
-                headers=self._sanitize_headers(dict(response.headers)),
-                body=response.text,
-                duration=duration
-            )
+            if log_active:
+                self.logger.log_response(
+                    status_code=response.status_code,
+                    headers=self._sanitize_headers(response.headers),
+                    body=response.content[:MAX_LOGGED_BODY_BYTES],
+                    duration=duration
+                )
 
             # Validate response if required
             if validate_schema:
@@ -224,7 +529,7 @@ class TestClient:
             return response
 
         except Exception as e:
-            self.metrics["failed_requests"] += 1
+            self.metrics.failed_requests += 1
             self.logger.log_error(
                 error=str(e),
                 context={
@@ -234,6 +539,48 @@ class TestClient:
             )
             raise
 
+    async def bulk(
+        self,
+        specs: List[Tuple[str, str, Dict[str, Any]]],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> List[Union[httpx.Response, BaseException]]:
+        """
+        Issues many requests concurrently with a bound on in-flight requests.
+
+        Args:
+            specs: (method, endpoint, kwargs) tuples; method is "GET" or "POST" and
+                kwargs are passed to the matching request method
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Responses or raised exceptions, in the same order as specs
+
+        Raises:
+            ValueError: If concurrency is below 1 or a spec names an unsupported method
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+
+        # Resolve every method up front so a bad spec fails before any request is sent
+        methods = {"GET": self.get, "POST": self.post}
+        requests = []
+        for method, endpoint, kwargs in specs:
+            send = methods.get(method.upper())
+            if send is None:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+            requests.append((send, endpoint, kwargs))
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _send(send: Any, endpoint: str, kwargs: Dict[str, Any]) -> httpx.Response:
+            async with semaphore:
+                return await send(endpoint, **kwargs)
+
+        return await asyncio.gather(
+            *(_send(send, endpoint, kwargs) for send, endpoint, kwargs in requests),
+            return_exceptions=True
+        )
+
     def _merge_headers(self, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """
         Merges custom headers with defaults, maintaining security headers.
@@ -242,28 +589,46 @@ class TestClient:
             headers: Custom headers to merge
 
         Returns:
-            Merged headers dictionary
+            Merged headers dictionary; the shared defaults when there is nothing to merge
         """
-        merged = self.headers.copy()
-        if headers:
-            merged.update(headers)
-        return merged
+        if not headers:
+            # httpx does not mutate request headers, so the defaults can be passed as-is
+            return self.headers
+        return {**self.headers, **headers}
 
-    def _sanitize_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
+    def _sanitize_headers(
+        self,
+        headers: Union[Dict[str, str], httpx.Headers]
+    ) -> Dict[str, str]:
         """
         Sanitizes sensitive information from headers for logging.
 
         Args:
-            headers: Headers to sanitize
+            headers: Headers to sanitize, either a plain dict or httpx response headers
 
         Returns:
-            Sanitized headers dictionary
+            Sanitized headers dictionary, or a plain dict input itself when nothing is sensitive
         """
-        sanitized = headers.copy()
-        for header in SENSITIVE_HEADERS:
-            if header.lower() in sanitized:
-                sanitized[header] = "[REDACTED]"
-        return sanitized
+        if isinstance(headers, httpx.Headers):
+            # Read the raw pairs directly rather than materialising dict(headers) first;
+            # names are lower-cased and repeats joined with ", " as dict(headers) would
+            encoding = headers.encoding
+            sanitized: Dict[str, str] = {}
+            for raw_name, raw_value in headers.raw:
+                name = raw_name.decode(encoding).lower()
+                value = (
+                    "[REDACTED]" if name in SENSITIVE_HEADERS_LOWER
+                    else raw_value.decode(encoding)
+                )
+                sanitized[name] = f"{sanitized[name]}, {value}" if name in sanitized else value
+            return sanitized
+
+        if not any(k.lower() in SENSITIVE_HEADERS_LOWER for k in headers):
+            return headers
+        return {
+            k: "[REDACTED]" if k.lower() in SENSITIVE_HEADERS_LOWER else v
+            for k, v in headers.items()
+        }
 
     def _sanitize_request_body(self, data: Optional[Dict]) -> Optional[Dict]:
         """
@@ -278,22 +643,7 @@ class TestClient:
         if not data:
             return data
 
-        sensitive_keys = {"password", "token", "secret", "key"}
-        sanitized = json.loads(json.dumps(data))  # Deep copy
-
-        def _redact_sensitive(obj: Union[Dict, list]) -> Union[Dict, list]:
-            if isinstance(obj, dict):
-                return {
-                    k: "[REDACTED]" if any(s in k.lower() for s in sensitive_keys)
-                    else _redact_sensitive(v) if isinstance(v, (dict, list)) else v
-                    for k, v in obj.items()
-                }
-            elif isinstance(obj, list):
-                return [_redact_sensitive(i) if isinstance(i, (dict, list)) else i
-                       for i in obj]
-            return obj
-
-        return _redact_sensitive(sanitized)
+        return _redact_request_body(data)
 
     def _validate_response(self, response: httpx.Response) -> None:
         """
@@ -315,7 +665,7 @@ class TestClient:
         content_type = response.headers.get("content-type", "")
         if "application/json" in content_type:
             try:
-                response.json()
+                _json_loads(response.content)
             except json.JSONDecodeError as e:
                 raise AssertionError(f"Invalid JSON response: {str(e)}")
 
@@ -327,23 +677,49 @@ class TestClient:
             status_code: Response status code
             duration: Request duration in seconds
         """
-        self.metrics["requests"] += 1
-        self.metrics["total_response_time"] += duration
+        metrics = self.metrics
+        metrics.requests += 1
+        metrics.total_response_time += duration
         
         if 200 <= status_code < 300:
-            self.metrics["successful_requests"] += 1
+            metrics.successful_requests += 1
         else:
-            self.metrics["failed_requests"] += 1
+            metrics.failed_requests += 1
 
-    async def close(self) -> None:
-        """Closes the HTTP client connection and performs cleanup."""
-        await self._client.aclose()
+    def reset_metrics(self) -> None:
+        """Resets request metrics, e.g. when a memoized client is handed to a new test."""
+        self.metrics = RequestMetrics()
+
+    def _report_metrics(self) -> None:
+        """Logs the collected request metrics as the client's test result."""
         self.logger.end_test(
             test_name="test_client",
-            passed=self.metrics["failed_requests"] == 0,
-            final_context={"metrics": self.metrics}
+            passed=self.metrics.failed_requests == 0,
+            final_context={"metrics": self.metrics.as_dict()}
         )
 
+    async def close(self) -> None:
+        """Closes the HTTP client connection if owned and performs cleanup."""
+        await self._close_client()
+        self._report_metrics()
+
+    async def _close_client(self) -> None:
+        """Closes the HTTP client connection if owned, without reporting metrics."""
+        if self._owns_client:
+            await self._client.aclose()
+
+# TestClient instances shared by create_test_client, keyed by their configuration
+_CLIENTS: Dict[Tuple, TestClient] = {}
+
+async def close_test_clients() -> None:
+    """
+    Closes every memoized TestClient; called once at the end of the test session.
+    Their metrics were already reported per test by create_test_client.
+    """
+    while _CLIENTS:
+        _, test_client = _CLIENTS.popitem()
+        await test_client._close_client()
+
 @pytest.fixture
 @contextlib.asynccontextmanager
 async def create_test_client(
@@ -351,7 +727,8 @@ async def create_test_client(
     headers: Optional[Dict[str, str]] = None,
     timeout: Optional[float] = None,
     verify_ssl: Optional[bool] = None,
-    logger_config: Optional[Dict] = None
+    logger_config: Optional[Dict] = None,
+    client: Optional[httpx.AsyncClient] = None
 ) -> Generator[TestClient, None, None]:
     """
     Creates and configures a test HTTP client instance with enhanced logging
@@ -363,19 +740,40 @@ async def create_test_client(
         timeout: Optional request timeout
         verify_ssl: Optional SSL verification flag
         logger_config: Optional logger configuration
+        client: Optional shared HTTP client, e.g. the session-scoped `http_client` fixture
 
     Yields:
-        Configured test client instance
+        Configured test client instance, shared by calls with identical configuration
     """
-    client = TestClient(
-        base_url=base_url,
-        headers=headers,
-        timeout=timeout,
-        verify_ssl=verify_ssl,
-        logger_config=logger_config
+    # Logger configs may hold unhashable values, so clients created with one are not shared
+    shared = not logger_config
+    key = (
+        base_url,
+        frozenset((headers or {}).items()),
+        timeout,
+        verify_ssl,
+        client
     )
+    test_client = _CLIENTS.get(key) if shared else None
+    if test_client is None:
+        test_client = TestClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            verify_ssl=verify_ssl,
+            logger_config=logger_config,
+            client=client
+        )
+        if shared:
+            _CLIENTS[key] = test_client
+    else:
+        test_client.reset_metrics()
     
     try:
-        yield client
+        yield test_client
     finally:
-        await client.close()
\ No newline at end of file
+        if shared:
+            # Report per-test metrics; the client itself is closed by close_test_clients()
+            test_client._report_metrics()
+        else:
+            await test_client.close()
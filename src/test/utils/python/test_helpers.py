@@ -5,6 +5,8 @@ security, and performance capabilities.
 Version: 1.0.0
 """
 
+import copy
+import functools
 import json
 import unittest
 from typing import Dict, Optional, Any, Callable
@@ -14,6 +16,11 @@ from pathlib import Path
 import pytest  # v7.0.0
 from unittest.mock import Mock, MagicMock
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
 from .test_logger import configure_test_logger, TestLogger
 
 # Constants
@@ -21,6 +28,9 @@ TEST_DATA_DIR = Path(__file__).parent.parent / "data"
 PERFORMANCE_THRESHOLD_MS = 1000  # 1 second
 MAX_TEST_ARTIFACTS_SIZE = 10 * 1024 * 1024  # 10MB
 
+# Fixture files are parsed from raw bytes; json.loads accepts bytes as well
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 class TestBase(unittest.TestCase):
     """
     Enhanced base test class providing comprehensive test utilities with monitoring,
@@ -52,6 +62,8 @@ class TestBase(unittest.TestCase):
         # Initialize tracking containers
         self.performance_metrics: Dict[str, float] = {}
         self.test_artifacts: Dict[str, Any] = {}
+        self._artifact_sizes: Dict[str, int] = {}
+        self._artifacts_total_bytes = 0
         self.security_context: Dict[str, Any] = {
             "test_isolation": True,
             "data_sanitization": True,
@@ -147,7 +159,27 @@ class TestBase(unittest.TestCase):
         """Prepares directory for test artifacts."""
         artifacts_dir = TEST_DATA_DIR / "artifacts"
         artifacts_dir.mkdir(exist_ok=True)
-        self.test_artifacts["directory"] = str(artifacts_dir)
+        self.add_artifact("directory", str(artifacts_dir))
+
+    def add_artifact(self, name: str, artifact: Any, size_hint: Optional[int] = None) -> None:
+        """
+        Stores a test artifact and tracks its size for the teardown size check.
+
+        Args:
+            name: Artifact name; an existing artifact with this name is replaced
+            artifact: Artifact payload
+            size_hint: Optional payload size in bytes, skips measuring the payload
+        """
+        if size_hint is not None:
+            size = size_hint
+        elif isinstance(artifact, (bytes, bytearray)):
+            size = len(artifact)
+        else:
+            size = len(str(artifact).encode())
+        
+        self._artifacts_total_bytes += size - self._artifact_sizes.get(name, 0)
+        self._artifact_sizes[name] = size
+        self.test_artifacts[name] = artifact
 
     def _cleanup_test_data(self) -> None:
         """Cleans up test data with validation."""
@@ -157,10 +189,7 @@ class TestBase(unittest.TestCase):
 
     def _archive_test_artifacts(self) -> None:
         """Archives test artifacts with size validation."""
-        total_size = sum(
-            len(str(artifact).encode()) 
-            for artifact in self.test_artifacts.values()
-        )
+        total_size = self._artifacts_total_bytes
         if total_size > self.test_config["max_artifacts_size"]:
             self.logger.log_assertion(
                 "artifacts_size_check",
@@ -279,6 +308,9 @@ def load_test_data(
     """
     Enhanced test data loader with validation and transformation capabilities.
 
+    Results for the default arguments are parsed once per fixture; each caller
+    gets its own deep copy, so tests may mutate the returned data freely.
+
     Args:
         fixture_name: Name of the test fixture
         transform_rules: Optional data transformation rules
@@ -287,24 +319,10 @@ def load_test_data(
     Returns:
         Validated and transformed test data
     """
-    fixture_path = TEST_DATA_DIR / f"{fixture_name}.json"
-    
     try:
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
-        
-        # Apply transformations if specified
-        if transform_rules:
-            data = _apply_data_transformations(data, transform_rules)
-        
-        # Validate against schema if required
-        if validate_schema:
-            _validate_data_schema(data, fixture_name)
-        
-        # Sanitize sensitive data
-        data = _sanitize_test_data(data)
-        
-        return data
+        if not transform_rules and validate_schema:
+            return copy.deepcopy(_load_cached_test_data(fixture_name))
+        return _load_test_data(fixture_name, transform_rules, validate_schema)
     
     except Exception as e:
         logger = configure_test_logger("test_data_loader")
@@ -318,6 +336,34 @@ def load_test_data(
         )
         raise
 
+def _load_test_data(
+    fixture_name: str,
+    transform_rules: Optional[Dict],
+    validate_schema: bool
+) -> Dict:
+    """Reads, transforms, validates and sanitizes a fixture file."""
+    fixture_path = TEST_DATA_DIR / f"{fixture_name}.json"
+    
+    # Parse straight from bytes to skip building an intermediate str
+    with open(fixture_path, 'rb') as f:
+        data = _json_loads(f.read())
+    
+    # Apply transformations if specified
+    if transform_rules:
+        data = _apply_data_transformations(data, transform_rules)
+    
+    # Validate against schema if required
+    if validate_schema:
+        _validate_data_schema(data, fixture_name)
+    
+    # Sanitize sensitive data
+    return _sanitize_test_data(data)
+
+@functools.lru_cache(maxsize=None)
+def _load_cached_test_data(fixture_name: str) -> Dict:
+    """Loads a fixture with default options once per process."""
+    return _load_test_data(fixture_name, None, True)
+
 def _verify_environment_isolation(environment: str) -> None:
     """Verifies test environment isolation."""
     # Implementation details omitted for brevity
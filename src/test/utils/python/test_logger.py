@@ -5,34 +5,113 @@ structured error tracking, and performance metrics collection.
 Version: 1.0.0
 """
 
+import functools
+import io
+import logging
+import logging.handlers
 import time
-from typing import Dict, Optional, Any, List
+from typing import Callable, Dict, Optional, Any, List, Set, Tuple, Union
 from dataclasses import dataclass, field
-import json
 
 import pytest  # v7.0.0
 import structlog  # v23.1.0
 
-from backend.content_discovery.app.utils.logger import setup_logging, get_logger
+from backend.content_discovery.app.utils.logger import (
+    setup_logging,
+    get_logger,
+    get_queue_listener
+)
 
 # Constants
-TEST_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(test_case)s - %(message)s"
-MAX_TEST_ARTIFACTS_SIZE = 10 * 1024 * 1024  # 10MB
 PERFORMANCE_THRESHOLD_MS = 1000  # 1 second
+MAX_BUFFERED_ASSERTIONS = 1000  # flush passing assertion events in batches of this size
+LOG_STREAM_BUFFER_SIZE = 64 * 1024  # 64KB
+_SENSITIVE_KEYS = frozenset({
+    "password", "token", "api_key", "secret",
+    "authorization", "access_token", "refresh_token"
+})
+# First characters of the sensitive keys in either case; keys starting with anything
+# else cannot match, so they skip the lower() allocation. Keys that are already
+# lowercase, the usual case, are looked up as-is.
+_SENSITIVE_INITIALS = frozenset(
+    initial for key in _SENSITIVE_KEYS for initial in (key[0], key[0].upper())
+)
+
+# Sanitizers specialized for registered context shapes, see register_context_schema()
+_CONTEXT_SANITIZERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
 
 # Initialize structured logger
 test_logger = structlog.get_logger(__name__)
 
-@dataclass
+# setup_logging()'s listener once taken over by start_log_queue()
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+# setup_logging() adds root handlers on every call, so it must only run once
+_logging_configured = False
+# (handler, original stream, buffered stream) for handlers moved behind the queue
+_buffered_streams: List[Tuple[logging.StreamHandler, Any, "_BufferedLogStream"]] = []
+# TestLoggers holding buffered passing assertions; flushed by stop_log_queue()
+_PENDING_ASSERTION_LOGGERS: Set["TestLogger"] = set()
+
+class _BufferedLogStream(io.TextIOWrapper):
+    """
+    Text stream over a large write buffer. StreamHandler flushes after every record,
+    so flush() is a no-op here; data is written when the buffer fills or on drain(),
+    which flush_log_streams() calls at every test boundary.
+    """
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> None:
+        """Writes out everything buffered so far."""
+        super().flush()
+
+@dataclass(slots=True)
 class TestMetrics:
     """Container for test execution metrics"""
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=time.perf_counter)  # monotonic, for durations only
     end_time: float = 0.0
     assertions: int = 0
     passed_assertions: int = 0
     failed_assertions: int = 0
-    performance_samples: List[float] = field(default_factory=list)
+    sample_count: int = 0
+    sample_sum: float = 0.0
+    sample_max: float = 0.0
     error_count: int = 0
+    assertion_events: List[Dict[str, Any]] = field(default_factory=list)
+
+def _record_assertion(metrics: TestMetrics, passed: bool, duration_ms: Optional[float]) -> None:
+    """Adds one assertion outcome and its optional duration to a metrics container."""
+    metrics.assertions += 1
+    if passed:
+        metrics.passed_assertions += 1
+    else:
+        metrics.failed_assertions += 1
+    
+    if duration_ms is not None:
+        metrics.sample_count += 1
+        metrics.sample_sum += duration_ms
+        if duration_ms > metrics.sample_max:
+            metrics.sample_max = duration_ms
+
+# Assertion counts and timing across every TestLogger in the session
+_SESSION_METRICS = TestMetrics()
+
+def session_assertion_summary() -> Dict[str, Any]:
+    """
+    Summarizes assertion counts and timing aggregated over the whole session.
+
+    Returns:
+        Assertion totals and average/max assertion duration in milliseconds
+    """
+    metrics = _SESSION_METRICS
+    return {
+        "total": metrics.assertions,
+        "passed": metrics.passed_assertions,
+        "failed": metrics.failed_assertions,
+        "avg_ms": metrics.sample_sum / metrics.sample_count if metrics.sample_count else 0,
+        "max_ms": metrics.sample_max
+    }
 
 class TestLogger:
     """
@@ -40,6 +119,11 @@ class TestLogger:
     and error tracking capabilities.
     """
 
+    __slots__ = (
+        "_logger", "_log_pass", "_log_fail", "_test_name", "_metrics", "_level", "_enabled",
+        "test_context", "_test_stats", "_performance_metrics", "_test_hierarchy"
+    )
+
     def __init__(
         self,
         test_name: str,
@@ -56,9 +140,16 @@ class TestLogger:
         """
         # Initialize base logger
         self._logger = get_logger(f"test.{test_name}")
+        # Pre-bound result loggers, picked by outcome without a getattr per call
+        self._log_pass = self._logger.info
+        self._log_fail = self._logger.error
         self._test_name = test_name
         self._metrics = TestMetrics()
         
+        # Passing assertions log at INFO, so skip building their records above that level
+        self._level = getattr(logging, log_level.upper(), logging.INFO)
+        self._enabled = self._level <= logging.INFO
+        
         # Initialize test context
         self.test_context = {
             "test_name": test_name,
@@ -67,11 +158,43 @@ class TestLogger:
             "environment": "test"
         }
         
-        # Initialize tracking containers
-        self.test_stats: Dict[str, Dict] = {}
-        self.performance_metrics: Dict[str, float] = {}
-        self.error_tracking: Dict[str, List] = {"errors": [], "warnings": []}
-        self.test_hierarchy: Dict[str, Any] = {"name": test_name, "children": []}
+        # Tracking containers are created on first access; many loggers never use them
+        self._test_stats: Optional[Dict[str, Dict]] = None
+        self._performance_metrics: Optional[Dict[str, float]] = None
+        self._test_hierarchy: Optional[Dict[str, Any]] = None
+
+    @property
+    def test_stats(self) -> Dict[str, Dict]:
+        """Per-test result summaries recorded by end_test."""
+        if self._test_stats is None:
+            self._test_stats = {}
+        return self._test_stats
+
+    @property
+    def performance_metrics(self) -> Dict[str, float]:
+        """Named performance measurements for the logged tests."""
+        if self._performance_metrics is None:
+            self._performance_metrics = {}
+        return self._performance_metrics
+
+    @property
+    def test_hierarchy(self) -> Dict[str, Any]:
+        """Tree of the logged test and its children."""
+        if self._test_hierarchy is None:
+            self._test_hierarchy = {"name": self._test_name, "children": []}
+        return self._test_hierarchy
+
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Checks whether records at the given level pass the configured log level.
+
+        Args:
+            level: Standard logging level, e.g. logging.INFO
+
+        Returns:
+            True if records at this level are emitted
+        """
+        return level >= self._level
 
     def start_test(self, test_name: str, test_context: Optional[Dict] = None) -> None:
         """
@@ -81,13 +204,19 @@ class TestLogger:
             test_name: Name of the test case
             test_context: Optional additional test context
         """
+        # Loggers may be reused across tests, so reset all per-test state; assertions
+        # buffered without an end_test are emitted rather than dropped
+        self._flush_assertion_events()
+        self._metrics = TestMetrics()
+        
+        if not self._enabled:
+            return
+        
         context = {
             "test_name": test_name,
             "start_time": time.time(),
             **(test_context or {})
         }
-        
-        self._metrics = TestMetrics()
         self._logger.info(
             "Starting test execution",
             test_case=test_name,
@@ -108,45 +237,53 @@ class TestLogger:
             passed: Whether the test passed
             final_context: Optional final test context
         """
-        self._metrics.end_time = time.time()
+        self._metrics.end_time = time.perf_counter()
         duration = self._metrics.end_time - self._metrics.start_time
+        # Buffered assertions are handed to the result below, not flushed at session end
+        _PENDING_ASSERTION_LOGGERS.discard(self)
+        metrics = self._metrics
+        assertion_events, metrics.assertion_events = metrics.assertion_events, []
         
-        # Prepare test results
-        result_context = {
+        # Summary kept in test_stats regardless of the log level
+        result_stats = {
             "test_name": test_name,
             "duration_ms": duration * 1000,
             "passed": passed,
             "assertions": {
-                "total": self._metrics.assertions,
-                "passed": self._metrics.passed_assertions,
-                "failed": self._metrics.failed_assertions
+                "total": metrics.assertions,
+                "passed": metrics.passed_assertions,
+                "failed": metrics.failed_assertions
             },
             "performance": {
-                "avg_ms": sum(self._metrics.performance_samples) / len(self._metrics.performance_samples)
-                if self._metrics.performance_samples else 0,
-                "max_ms": max(self._metrics.performance_samples) if self._metrics.performance_samples else 0
+                "avg_ms": metrics.sample_sum / metrics.sample_count
+                if metrics.sample_count else 0,
+                "max_ms": metrics.sample_max
             },
-            "errors": self.error_tracking["errors"],
             **(final_context or {})
         }
+        self.test_stats[test_name] = result_stats
         
-        # Log test completion
-        log_level = "info" if passed else "error"
-        getattr(self._logger, log_level)(
+        # Detailed payload is only assembled and sanitized when it will be logged
+        if not self.is_enabled_for(logging.INFO if passed else logging.ERROR):
+            return
+        result_context = {
+            **result_stats,
+            "error_count": metrics.error_count,
+            "assertions_detail": assertion_events
+        }
+        (self._log_pass if passed else self._log_fail)(
             "Test execution completed",
             test_case=test_name,
             result="PASS" if passed else "FAIL",
             context=self._sanitize_context(result_context)
         )
-        
-        # Update test statistics
-        self.test_stats[test_name] = result_context
 
     def log_assertion(
         self,
         assertion_name: str,
         passed: bool,
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        schema: Optional[str] = None
     ) -> None:
         """
         Logs test assertions with detailed context and performance impact.
@@ -155,33 +292,65 @@ class TestLogger:
             assertion_name: Name of the assertion
             passed: Whether the assertion passed
             context: Assertion context and details
+            schema: Optional name of a context shape registered with register_context_schema
         """
-        self._metrics.assertions += 1
-        if passed:
-            self._metrics.passed_assertions += 1
-        else:
-            self._metrics.failed_assertions += 1
+        sanitize = _CONTEXT_SANITIZERS.get(schema, self._sanitize_context)
+        
+        # Count into both this test's metrics and the session aggregate
+        duration_ms = context.get("duration_ms")
+        _record_assertion(self._metrics, passed, duration_ms)
+        _record_assertion(_SESSION_METRICS, passed, duration_ms)
+        
+        # Warn about slow assertions
+        if duration_ms is not None and duration_ms > PERFORMANCE_THRESHOLD_MS:
+            self._logger.warning(
+                "Assertion exceeded performance threshold",
+                assertion=assertion_name,
+                duration_ms=duration_ms,
+                threshold_ms=PERFORMANCE_THRESHOLD_MS
+            )
         
-        # Track performance if provided
-        if "duration_ms" in context:
-            self._metrics.performance_samples.append(context["duration_ms"])
-            if context["duration_ms"] > PERFORMANCE_THRESHOLD_MS:
-                self._logger.warning(
-                    "Assertion exceeded performance threshold",
-                    assertion=assertion_name,
-                    duration_ms=context["duration_ms"],
-                    threshold_ms=PERFORMANCE_THRESHOLD_MS
-                )
+        if passed:
+            if not self._enabled:
+                return
+            # Passing assertions are buffered and emitted together by end_test
+            events = self._metrics.assertion_events
+            _PENDING_ASSERTION_LOGGERS.add(self)
+            sanitized = sanitize(context)
+            # Sanitizers may return the caller's dict, which it could still mutate
+            if sanitized is context:
+                sanitized = dict(context)
+            events.append({
+                "assertion": assertion_name,
+                "result": "PASS",
+                "context": sanitized
+            })
+            if len(events) >= MAX_BUFFERED_ASSERTIONS:
+                self._flush_assertion_events()
+            return
         
-        # Log assertion result
-        log_level = "info" if passed else "error"
-        getattr(self._logger, log_level)(
+        # Failures are logged immediately unless even ERROR is filtered out
+        if not self.is_enabled_for(logging.ERROR):
+            return
+        self._log_fail(
             "Assertion executed",
             assertion=assertion_name,
-            result="PASS" if passed else "FAIL",
-            context=self._sanitize_context(context)
+            result="FAIL",
+            context=sanitize(context)
         )
 
+    def _flush_assertion_events(self) -> None:
+        """Emits buffered assertion events as one record, for loggers that never end a test."""
+        _PENDING_ASSERTION_LOGGERS.discard(self)
+        if not self._metrics.assertion_events:
+            return
+        self._log_pass(
+            "Assertions executed",
+            test_case=self._test_name,
+            assertions_detail=self._metrics.assertion_events
+        )
+        self._metrics.assertion_events = []
+
     def _sanitize_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Sanitizes sensitive data from test context.
@@ -192,24 +361,114 @@ class TestLogger:
         Returns:
             Sanitized context dictionary
         """
-        sensitive_keys = {
-            "password", "token", "api_key", "secret",
-            "authorization", "access_token", "refresh_token"
-        }
-        
-        def _redact_sensitive(obj: Any) -> Any:
-            if isinstance(obj, dict):
-                return {
-                    k: "[REDACTED]" if k.lower() in sensitive_keys else 
-                       _redact_sensitive(v) if isinstance(v, (dict, list)) else v
-                    for k, v in obj.items()
-                }
-            elif isinstance(obj, list):
-                return [_redact_sensitive(i) if isinstance(i, (dict, list)) else i 
-                        for i in obj]
+        return _redact_sensitive(context)
+
+def _has_sensitive_key(
+    obj: Union[Dict, List],
+    _sensitive_keys: frozenset = _SENSITIVE_KEYS,
+    _initials: frozenset = _SENSITIVE_INITIALS
+) -> bool:
+    """Checks whether a dict or list holds a sensitive key at any depth."""
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            for k, v in current.items():
+                if k[:1] in _initials and (k if k.islower() else k.lower()) in _sensitive_keys:
+                    return True
+                if isinstance(v, (dict, list)):
+                    stack.append(v)
+        else:
+            stack.extend(i for i in current if isinstance(i, (dict, list)))
+    return False
+
+def _redact_sensitive(
+    obj: Union[Dict, List],
+    _sensitive_keys: frozenset = _SENSITIVE_KEYS,
+    _initials: frozenset = _SENSITIVE_INITIALS
+) -> Union[Dict, List]:
+    """
+    Redacts values stored under sensitive keys at any depth.
+
+    Contexts without sensitive keys are returned as-is; otherwise a redacted copy
+    is built with an explicit stack rather than recursion.
+    """
+    if isinstance(obj, dict):
+        # Fast path for the common flat context: one pass, no stack allocation
+        for k, v in obj.items():
+            if isinstance(v, (dict, list)) or (
+                k[:1] in _initials and (k if k.islower() else k.lower()) in _sensitive_keys
+            ):
+                break
+        else:
             return obj
+
+    if not _has_sensitive_key(obj, _sensitive_keys, _initials):
+        return obj
+
+    root: Union[Dict, List] = {} if isinstance(obj, dict) else []
+    stack = [(obj, root)]
+    while stack:
+        source, target = stack.pop()
+        if isinstance(source, dict):
+            for k, v in source.items():
+                if k[:1] in _initials and (k if k.islower() else k.lower()) in _sensitive_keys:
+                    target[k] = "[REDACTED]"
+                elif isinstance(v, dict):
+                    target[k] = child = {}
+                    stack.append((v, child))
+                elif isinstance(v, list):
+                    target[k] = child = []
+                    stack.append((v, child))
+                else:
+                    target[k] = v
+        else:
+            for item in source:
+                if isinstance(item, dict):
+                    child = {}
+                elif isinstance(item, list):
+                    child = []
+                else:
+                    target.append(item)
+                    continue
+                target.append(child)
+                stack.append((item, child))
+    return root
+
+def register_context_schema(name: str, fields: Dict[str, type]) -> None:
+    """
+    Registers a fixed context shape so matching contexts skip the generic sanitizer walk.
+
+    Which fields are sensitive is decided once here; sanitizing a matching context
+    then only redacts those fields and walks values that are dicts or lists.
+    Contexts whose keys differ from the schema fall back to the generic sanitizer.
+
+    Args:
+        name: Schema name passed to log_assertion
+        fields: Context field names mapped to their expected types
+    """
+    known_fields = frozenset(fields)
+    redacted_fields = tuple(f for f in fields if f.lower() in _SENSITIVE_KEYS)
+    plain_fields = tuple(f for f in fields if f not in redacted_fields)
+
+    def _sanitize(context: Dict[str, Any]) -> Dict[str, Any]:
+        if context.keys() != known_fields:
+            return _redact_sensitive(context)
         
-        return _redact_sensitive(context)
+        nested = [
+            f for f in plain_fields if isinstance(context[f], (dict, list))
+        ]
+        if not redacted_fields and not nested:
+            return context
+        
+        sanitized = dict(context)
+        for f in redacted_fields:
+            sanitized[f] = "[REDACTED]"
+        for f in nested:
+            sanitized[f] = _redact_sensitive(context[f])
+        return sanitized
+
+    _CONTEXT_SANITIZERS[name] = _sanitize
 
 def configure_test_logger(
     test_name: str,
@@ -228,7 +487,7 @@ def configure_test_logger(
         Configured test logger instance
     """
     # Initialize base logging
-    setup_logging()
+    _ensure_logging_configured()
     
     # Create and configure test logger
     logger = TestLogger(
@@ -239,6 +498,86 @@ def configure_test_logger(
     
     return logger
 
+def _ensure_logging_configured() -> None:
+    """Runs the service logging setup once per process."""
+    global _logging_configured
+    if not _logging_configured:
+        setup_logging()
+        _logging_configured = True
+
+def start_log_queue() -> None:
+    """
+    Takes over the queue listener that setup_logging() started, batching its console
+    writes. pytest's own handlers and any file handlers are left untouched. Call once
+    per session after logging has been configured.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        return
+    
+    _queue_listener = get_queue_listener()
+    if _queue_listener is None:
+        return
+    for handler in _queue_listener.handlers:
+        if isinstance(handler, logging.StreamHandler):
+            _buffer_handler_stream(handler)
+
+def stop_log_queue() -> None:
+    """
+    Writes out buffered assertions and queued test log records and stops the
+    background listener.
+    """
+    global _queue_listener
+    # Loggers that never called end_test, e.g. module-scoped ones, still hold events
+    for logger in list(_PENDING_ASSERTION_LOGGERS):
+        logger._flush_assertion_events()
+    
+    if _queue_listener is not None:
+        # Stopping the listener writes out every record still queued
+        _queue_listener.stop()
+        _queue_listener = None
+    
+    # Restore the original streams without closing the ones they wrap
+    while _buffered_streams:
+        handler, stream, buffered = _buffered_streams.pop()
+        buffered.drain()
+        handler.setStream(stream)
+        buffered.detach().detach()
+
+def flush_log_streams() -> None:
+    """Writes out buffered console log output; called at the end of every test."""
+    for handler, _, buffered in _buffered_streams:
+        # The listener thread may be writing, so drain under the handler's lock
+        handler.acquire()
+        try:
+            buffered.drain()
+        finally:
+            handler.release()
+
+def _buffer_handler_stream(handler: logging.StreamHandler) -> None:
+    """
+    Puts a large write buffer in front of a handler's stream so records are written
+    in batches. Only used for console handlers driven by the queue listener thread;
+    file handlers keep writing through so log files stay current.
+
+    Args:
+        handler: Stream handler whose stream to buffer
+    """
+    if isinstance(handler, logging.FileHandler):
+        return
+    stream = handler.stream
+    binary = getattr(stream, "buffer", None)
+    if binary is None:
+        return
+    
+    buffered = _BufferedLogStream(
+        io.BufferedWriter(binary, buffer_size=LOG_STREAM_BUFFER_SIZE),
+        encoding=getattr(stream, "encoding", None),
+        errors=getattr(stream, "errors", None)
+    )
+    handler.setStream(buffered)
+    _buffered_streams.append((handler, stream, buffered))
+
 def log_test_result(
     test_name: str,
     passed: bool,
@@ -252,18 +591,43 @@ def log_test_result(
         passed: Whether the test passed
         context: Test execution context and metrics
     """
-    sanitized_context = TestLogger._sanitize_context(TestLogger, context)
+    sanitized_context = _redact_sensitive(context)
     
-    log_level = "info" if passed else "error"
-    getattr(test_logger, log_level)(
+    bound_logger = _bound_test_logger(test_name)
+    (bound_logger.info if passed else bound_logger.error)(
         "Test result logged",
-        test_case=test_name,
         result="PASS" if passed else "FAIL",
         context=sanitized_context
     )
 
+@functools.lru_cache(maxsize=256)
+def _bound_test_logger(test_name: str) -> Any:
+    """Returns the module logger bound to a test case, reused when a test logs repeatedly."""
+    return test_logger.bind(test_case=test_name)
+
+@pytest.fixture(scope="session")
+def _base_test_logging() -> None:
+    """Configures base logging once for the whole test session."""
+    _ensure_logging_configured()
+
+@pytest.fixture(scope="module")
+def _module_test_logger(request, _base_test_logging) -> TestLogger:
+    """
+    Provides one TestLogger per test module; start_test resets it between tests.
+
+    Args:
+        request: Pytest request object
+
+    Returns:
+        TestLogger shared by the module's tests
+    """
+    return TestLogger(
+        test_name=request.module.__name__,
+        suite_context={"module": request.module.__name__}
+    )
+
 @pytest.fixture
-def test_logger_fixture(request) -> TestLogger:
+def test_logger_fixture(request, _module_test_logger: TestLogger) -> TestLogger:
     """
     Pytest fixture that provides a configured TestLogger instance.
 
@@ -273,10 +637,7 @@ def test_logger_fixture(request) -> TestLogger:
     Returns:
         Configured TestLogger instance
     """
-    logger = configure_test_logger(
-        test_name=request.node.name,
-        test_suite_context={"module": request.module.__name__}
-    )
+    logger = _module_test_logger
     
     # Setup test
     logger.start_test(request.node.name)
@@ -285,4 +646,4 @@ def test_logger_fixture(request) -> TestLogger:
     
     # Teardown and log results
     passed = not request.session.testsfailed
-    logger.end_test(request.node.name, passed)
\ No newline at end of file
+    logger.end_test(request.node.name, passed)